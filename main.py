@@ -15,18 +15,18 @@ Usage:
 """
 
 import sys
-import argparse
-from pathlib import Path
+import functools
+import importlib.util
 
 def main():
     """Main entry point for handling CLI or guiding user to run Streamlit."""
 
-    # Check if Streamlit is available
-    try:
-        import streamlit
-        STREAMLIT_AVAILABLE = True
-    except ImportError:
-        STREAMLIT_AVAILABLE = False
+    # Fast path: hand everything after --cli straight to the CLI parser
+    if len(sys.argv) > 1 and sys.argv[1] == "--cli":
+        return run_cli(sys.argv[2:])
+
+    # Imported here so 'streamlit run main.py', which never calls main(), skips it
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="WhatsApp Chat Analyzer - Unified Entry Point",
@@ -42,15 +42,14 @@ def main():
         help="Force CLI mode"
     )
 
-    # Pass through any other arguments to CLI
-    parser.add_argument("cli_args", nargs=argparse.REMAINDER, help="CLI arguments")
-
-    args = parser.parse_args()
+    # Any arguments not recognised here are passed through to the CLI
+    args, cli_args = parser.parse_known_args()
 
     # Determine which interface to use
     if args.cli:
-        run_cli(args.cli_args)
-    elif STREAMLIT_AVAILABLE:
+        run_cli(cli_args)
+    # Only probe for Streamlit when the CLI was not requested
+    elif importlib.util.find_spec("streamlit") is not None:
         # If no flags are provided and Streamlit is installed, guide the user.
         print("✅ Streamlit UI is available.")
         print("   To launch the web interface, please run this command in your terminal:")
@@ -60,14 +59,19 @@ def main():
         print("💻 Streamlit not available. Running in CLI mode.")
         run_cli(["--help"])
 
+@functools.lru_cache(maxsize=1)
+def _get_streamlit_main():
+    """Resolve the Streamlit app entry point once per process."""
+    from whatsapp_analyzer.ui.streamlit_app import main as streamlit_main
+    return streamlit_main
+
 def run_streamlit_ui():
     """
     This function contains the Streamlit app logic.
     It will be executed automatically when you run 'streamlit run main.py'.
     """
     try:
-        from whatsapp_analyzer.ui.streamlit_app import main as streamlit_main
-        streamlit_main()
+        _get_streamlit_main()()
     except Exception as e:
         # In a real Streamlit app, you might use st.error(e)
         print(f"❌ Streamlit UI error: {e}")
@@ -81,15 +85,10 @@ def run_cli(cli_args):
         if not cli_args:
             cli_args = ["--help"]
 
-        # Set sys.argv for CLI argument parsing
-        original_argv = sys.argv
-        sys.argv = ["whatsapp-analyzer"] + cli_args
-
-        try:
-            cli_main()
-        finally:
-            # Restore original argv
-            sys.argv = original_argv
+        # Pass arguments explicitly instead of rewriting sys.argv
+        exit_code = cli_main(cli_args)
+        if exit_code:
+            sys.exit(exit_code)
 
     except ImportError as e:
         print(f"❌ Failed to import CLI: {e}")
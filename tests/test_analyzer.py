@@ -0,0 +1,218 @@
+"""
+Tests for the chat analyzer module.
+
+This module covers ChatAnalyzer's activity, engagement and sentiment
+analyses on DataFrames built directly, without going through the parser.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from whatsapp_analyzer.core import analyzer
+from whatsapp_analyzer.core.analyzer import ChatAnalyzer
+from whatsapp_analyzer.core.parser import DAYS_OF_WEEK
+from whatsapp_analyzer.utils.emoji_extractor import extract_emojis
+
+
+def make_chat(rows, categorical=True):
+    """
+    Build a chat DataFrame shaped like the parser's output.
+
+    Args:
+        rows: (timestamp, author, message) tuples
+        categorical: Store Author and dow as categoricals, as the parser does
+    """
+    ts = pd.to_datetime([row[0] for row in rows])
+    df = pd.DataFrame({
+        "Date": ts.strftime("%m/%d/%Y"),
+        "Time": ts.strftime("%H:%M"),
+        "Author": [row[1] for row in rows],
+        "Message": [row[2] for row in rows],
+        "ts": ts,
+    })
+    df["date"] = df["ts"].dt.normalize()
+    df["hour"] = df["ts"].dt.hour.astype("int8")
+    df["dow"] = df["ts"].dt.day_name()
+    df["is_media"] = df["Message"].eq("<Media omitted>")
+    if categorical:
+        df["Author"] = df["Author"].astype("category")
+        df["dow"] = pd.Categorical(df["dow"], categories=DAYS_OF_WEEK, ordered=True)
+    return df
+
+
+CHAT = [
+    ("2024-01-01 09:00", "Alice", "Morning!"),        # Monday
+    ("2024-01-01 09:05", "Bob", "Hi Alice"),
+    ("2024-01-01 09:06", "Bob", "How are you?"),
+    ("2024-01-01 12:00", "Alice", "Lunch?"),
+    ("2024-01-03 21:30", "Carol", "<Media omitted>"),  # Wednesday
+    ("2024-01-03 21:45", "Alice", "Nice photo"),
+]
+
+
+class TestActivity:
+    """Test message counts over time."""
+
+    def test_hourly_activity(self):
+        """Test counts per hour of the day."""
+        hourly = ChatAnalyzer(make_chat(CHAT)).get_hourly_activity()
+        assert hourly.to_dict() == {9: 3, 12: 1, 21: 2}
+
+    def test_daily_activity(self):
+        """Test counts per weekday, Monday first with zeros for quiet days."""
+        daily = ChatAnalyzer(make_chat(CHAT)).get_daily_activity()
+        assert list(daily.index) == list(DAYS_OF_WEEK)
+        assert daily.tolist() == [4, 0, 2, 0, 0, 0, 0]
+
+    def test_daily_activity_plain_strings(self):
+        """Test that a plain string dow column gets the same layout."""
+        daily = ChatAnalyzer(make_chat(CHAT, categorical=False)).get_daily_activity()
+        assert list(daily.index) == list(DAYS_OF_WEEK)
+        assert daily.tolist() == [4, 0, 2, 0, 0, 0, 0]
+
+    def test_participant_chart_skips_filtered_authors(self):
+        """Test that authors filtered out of a categorical column are not charted."""
+        chat = ChatAnalyzer(make_chat(CHAT))
+        chat.chat_data = chat.chat_data[chat.chat_data["Author"] != "Carol"]
+        chart = chat.create_participant_activity_chart()
+        assert list(chart.data[0].x) == ["Alice", "Bob"]
+
+
+class TestEngagement:
+    """Test author-change detection, response times and conversation starters."""
+
+    @pytest.mark.parametrize("categorical", [True, False])
+    def test_author_change_mask(self, categorical):
+        """Test that the first message and every change of author are flagged."""
+        chat = ChatAnalyzer(make_chat(CHAT, categorical=categorical))
+        _, changed = chat._get_message_gaps()
+        assert changed.tolist() == [True, True, False, True, True, True]
+
+    def test_response_times(self):
+        """Test that only replies to another author within the threshold count."""
+        response_times = ChatAnalyzer(make_chat(CHAT)).get_response_times(1)
+        assert response_times.to_dict() == {"Alice": 900.0, "Bob": 300.0}
+
+    @pytest.mark.parametrize("categorical", [True, False])
+    def test_conversation_starters(self, categorical):
+        """Test that messages after a long gap start conversations."""
+        chat = ChatAnalyzer(make_chat(CHAT, categorical=categorical))
+        starters = chat.get_conversation_starters(1)
+        assert starters.to_dict() == {"Alice": 1, "Carol": 1}
+
+    def test_longer_threshold_merges_conversations(self):
+        """Test that a longer threshold leaves only the multi-day gap."""
+        starters = ChatAnalyzer(make_chat(CHAT)).get_conversation_starters(6)
+        assert starters.to_dict() == {"Carol": 1}
+
+
+class TestCaching:
+    """Test that memoized results follow chat_data."""
+
+    NEW_CHAT = [
+        ("2024-02-06 18:00", "Dave", "Pizza tonight 🍕"),  # Tuesday
+        ("2024-02-06 18:10", "Erin", "Pizza again 🍕😀"),
+    ]
+
+    def test_repeated_calls_share_results(self):
+        """Test that a second call returns the cached object."""
+        chat = ChatAnalyzer(make_chat(CHAT))
+        assert chat.get_basic_stats() is chat.get_basic_stats()
+        assert chat.create_hourly_activity_chart() is chat.create_hourly_activity_chart()
+
+    def test_assigning_chat_data_recomputes(self):
+        """Test that reassigning chat_data drops every stale result."""
+        chat = ChatAnalyzer(make_chat(CHAT))
+        old_stats = chat.get_basic_stats()
+        old_chart = chat.create_hourly_activity_chart()
+        old_insights = chat.get_all_insights()
+        assert "pizza" not in dict(chat.get_word_analysis()["top_words"])
+        assert chat.get_emoji_analysis(extract_emojis)["total_emojis"] == 0
+
+        chat.chat_data = make_chat(self.NEW_CHAT)
+
+        stats = chat.get_basic_stats()
+        assert stats is not old_stats
+        assert stats["total_messages"] == 2
+        assert stats["total_participants"] == 2
+        assert list(chat.create_hourly_activity_chart().data[0].x) == [18]
+        assert chat.create_hourly_activity_chart() is not old_chart
+        assert chat.get_daily_activity()["Tuesday"] == 2
+        assert chat.get_word_analysis()["top_words"][0] == ("pizza", 2)
+        assert chat.get_emoji_analysis(extract_emojis)["top_emojis"][0] == ("🍕", 2)
+        assert chat.get_all_insights()["basic_stats"] is stats
+        assert chat.get_all_insights() is not old_insights
+
+    def test_clear_cache_after_in_place_change(self):
+        """Test that clear_cache() picks up in-place edits to chat_data."""
+        chat = ChatAnalyzer(make_chat(CHAT))
+        assert chat.get_word_analysis()["top_words"][0] == ("morning", 1)
+
+        chat.chat_data.loc[:, "Message"] = "hello"
+        chat.clear_cache()
+        assert chat.get_word_analysis()["top_words"] == [("hello", 5)]
+
+
+class TestExport:
+    """Test the Excel analysis report."""
+
+    def test_excel_report_round_trip(self):
+        """Test that the report reloads with the expected sheets, headers and rows."""
+        chat = ChatAnalyzer(make_chat(CHAT))
+        buffer = io.BytesIO()
+        chat.export_analysis_report(buffer)
+        buffer.seek(0)
+
+        workbook = load_workbook(buffer, read_only=True)
+        assert workbook.sheetnames == ["Raw Data", "Participant Stats", "Summary"]
+        rows = {name: list(workbook[name].values) for name in workbook.sheetnames}
+
+        assert list(rows["Raw Data"][0]) == list(chat.chat_data.columns)
+        assert len(rows["Raw Data"]) == len(CHAT) + 1
+        assert [row[2] for row in rows["Raw Data"][1:]] == [row[1] for row in CHAT]
+
+        assert list(rows["Participant Stats"][0]) == [
+            "Author", "messages", "words", "media_sent", "avg_words"
+        ]
+        assert [row[:2] for row in rows["Participant Stats"][1:]] == [
+            ("Alice", 3), ("Bob", 2), ("Carol", 1)
+        ]
+
+        summary = dict(row for row in rows["Summary"][1:])
+        assert list(rows["Summary"][0]) == [None, "Value"]
+        assert summary["total_messages"] == len(CHAT)
+        assert summary["date_range"] == str(chat.get_basic_stats()["date_range"])
+
+
+class TestSentimentScoring:
+    """Test serial and parallel sentiment scoring."""
+
+    MESSAGES = [
+        "I love this, thank you so much!",
+        "This is terrible and I hate it.",
+        "ok",
+        "Meeting moved to 5pm",
+        "Not bad at all 😂",
+        "",
+    ]
+
+    def test_serial_by_default(self, monkeypatch):
+        """Test that scoring never starts a pool unless n_jobs asks for one."""
+        monkeypatch.setattr(analyzer, "SENTIMENT_PARALLEL_MIN_MESSAGES", 0)
+        monkeypatch.setattr(analyzer, "ProcessPoolExecutor", None)
+
+        scores = analyzer._score_messages_parallel(self.MESSAGES)
+        assert scores == analyzer._score_messages(self.MESSAGES)
+
+    def test_pool_matches_serial(self, monkeypatch, caplog):
+        """Test that the process pool returns the serial scores, in order."""
+        monkeypatch.setattr(analyzer, "SENTIMENT_PARALLEL_MIN_MESSAGES", 0)
+
+        with caplog.at_level("WARNING"):
+            scores = analyzer._score_messages_parallel(self.MESSAGES, n_jobs=2)
+
+        assert not caplog.records
+        assert scores == analyzer._score_messages(self.MESSAGES)
@@ -0,0 +1,135 @@
+"""
+Tests for the command-line interface.
+
+This module covers input reading, argument handling and exports, calling
+main() directly and checking exit codes and output.
+"""
+
+import io
+
+import pytest
+
+from whatsapp_analyzer import cli
+
+
+ANDROID_CHAT = (
+    "12/31/2023, 10:15 PM - Alice: Happy New Year 😀\n"
+    "12/31/2023, 10:16 PM - Bob: Same to you!\n"
+    "12/31/2023, 10:17 PM - Alice: <Media omitted>\n"
+).encode("utf-8")
+
+
+@pytest.fixture
+def chat_file(tmp_path):
+    """Write a small Android export and return its path."""
+    path = tmp_path / "chat.txt"
+    path.write_bytes(ANDROID_CHAT)
+    return path
+
+
+class TestInputReading:
+    """Test whole and chunked input readers."""
+
+    def test_read_input_file(self, chat_file):
+        """Test that the whole-file reader returns every byte."""
+        assert cli.read_input_file(str(chat_file)) == ANDROID_CHAT
+
+    def test_read_input_file_chunked(self, chat_file):
+        """Test that chunks reassemble to the file content."""
+        chunks = list(cli.read_input_file_chunked(str(chat_file), chunk_size=16))
+        assert len(chunks) > 1
+        assert b"".join(chunks) == ANDROID_CHAT
+
+    def test_read_stdin(self, monkeypatch):
+        """Test that the whole-stdin reader returns every byte."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(ANDROID_CHAT)))
+        assert cli.read_stdin() == ANDROID_CHAT
+
+    def test_empty_file_is_falsy(self, tmp_path):
+        """Test that an empty file reads as no data."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert not cli.read_input_file_chunked(str(path))
+        assert cli.read_input_file(str(path)) == b""
+
+    def test_empty_file_exits_with_error(self, tmp_path, caplog):
+        """Test that main() reports empty input instead of a detection error."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert cli.main(["--file", str(path)]) == 1
+        assert "No chat data available for analysis" in caplog.text
+
+
+class TestArguments:
+    """Test argument handling through main()."""
+
+    def test_sections_prints_only_selected(self, chat_file, capsys):
+        """Test that --sections limits the printed report."""
+        assert cli.main(["--file", str(chat_file), "--sections", "basic"]) == 0
+        out = capsys.readouterr().out
+        assert "BASIC STATISTICS" in out
+        assert "PARTICIPANTS" not in out
+
+    def test_sections_all(self, chat_file, capsys):
+        """Test that the default report prints every section."""
+        assert cli.main(["--file", str(chat_file)]) == 0
+        out = capsys.readouterr().out
+        assert "BASIC STATISTICS" in out
+        assert "PARTICIPANTS" in out
+
+    def test_unknown_section_rejected(self, chat_file, capsys):
+        """Test that argparse rejects section names it doesn't know."""
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(["--file", str(chat_file), "--sections", "nonsense"])
+        assert excinfo.value.code == 2
+        assert "invalid choice" in capsys.readouterr().err
+
+    def test_file_size_limit(self, chat_file, monkeypatch, caplog):
+        """Test that files over the configured size limit are refused."""
+        monkeypatch.setattr(cli, "get_max_file_size", lambda: 0)
+        assert cli.main(["--file", str(chat_file)]) == 1
+        assert "exceeding the 0 byte limit" in caplog.text
+
+    def test_file_within_size_limit(self, chat_file, monkeypatch):
+        """Test that files under the limit are read."""
+        monkeypatch.setattr(cli, "get_max_file_size", lambda: 1)
+        assert cli.main(["--file", str(chat_file), "--quiet"]) == 0
+
+
+class TestExport:
+    """Test --export with --format and --columns."""
+
+    def test_csv_columns_subset(self, chat_file, tmp_path):
+        """Test that --columns writes only the named columns, in order."""
+        output = tmp_path / "out.csv"
+        argv = [
+            "--file", str(chat_file), "--export", str(output),
+            "--format", "csv", "--columns", "Author", "Message",
+        ]
+        assert cli.main(argv) == 0
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines[0].replace('"', "") == "Author,Message"
+        assert len(lines) == 3
+
+    def test_csv_unknown_column(self, chat_file, tmp_path, caplog):
+        """Test that an unknown column fails the export without writing a file."""
+        output = tmp_path / "out.csv"
+        argv = [
+            "--file", str(chat_file), "--export", str(output),
+            "--format", "csv", "--columns", "Author", "Nope",
+        ]
+        assert cli.main(argv) == 1
+        assert "Unknown export columns: Nope" in caplog.text
+        assert not output.exists()
+
+    @pytest.mark.parametrize("format_type", ["excel", "json"])
+    def test_columns_rejected_for_other_formats(self, chat_file, tmp_path, capsys, format_type):
+        """Test that --columns is a usage error outside CSV exports."""
+        argv = [
+            "--file", str(chat_file), "--export", str(tmp_path / "out"),
+            "--format", format_type, "--columns", "Author",
+        ]
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(argv)
+        assert excinfo.value.code == 2
+        assert "--columns only applies to --format csv" in capsys.readouterr().err
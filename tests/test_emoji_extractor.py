@@ -0,0 +1,92 @@
+"""
+Tests for the emoji extraction utilities.
+
+This module covers grapheme-level emoji detection, including sequences
+whose modifier codepoints are not emoji on their own.
+"""
+
+import pytest
+
+from whatsapp_analyzer.utils import emoji_extractor
+
+
+class TestEmojiExtraction:
+    """Test emoji extraction from message text."""
+
+    def test_plain_text(self):
+        """Test that text without emoji yields nothing."""
+        assert emoji_extractor.extract_emojis("See you at 5, ok?") == []
+
+    def test_single_emojis(self):
+        """Test extraction of standalone emojis."""
+        assert emoji_extractor.extract_emojis("lol 😂 ok 🗿") == ["😂", "🗿"]
+
+    @pytest.mark.skipif(not emoji_extractor.USING_REGEX, reason="needs grapheme segmentation")
+    def test_keycap_sequence(self):
+        """Test that a keycap (digit + VS-16 + U+20E3) is one emoji."""
+        assert emoji_extractor.extract_emojis("pick 1️⃣ or #⃣") == [
+            "1️⃣", "#⃣"
+        ]
+
+    @pytest.mark.skipif(not emoji_extractor.USING_REGEX, reason="needs grapheme segmentation")
+    def test_stray_variation_selector(self):
+        """Test that VS-16 after a letter is not an emoji."""
+        assert emoji_extractor.extract_emojis("a️ b") == []
+
+    @pytest.mark.skipif(not emoji_extractor.USING_REGEX, reason="needs grapheme segmentation")
+    def test_emoji_presentation_sequence(self):
+        """Test that an emoji base keeps its VS-16 in one grapheme."""
+        assert emoji_extractor.extract_emojis("love ❤️") == ["❤️"]
+
+
+class TestEmojiStats:
+    """Test emoji statistics and category buckets."""
+
+    @pytest.mark.parametrize("emoji, category", [
+        ("😀", "faces"),
+        ("🐶", "animals"),
+        ("👍", "objects"),
+        ("⚽", "symbols"),
+        pytest.param("🇺🇸", "flags", marks=pytest.mark.skipif(
+            not emoji_extractor.USING_REGEX, reason="needs grapheme segmentation"
+        )),
+        ("🚀", "other"),
+    ])
+    def test_category(self, emoji, category):
+        """Test that each category bucket counts its representative emoji."""
+        stats = emoji_extractor.get_emoji_stats([emoji, emoji])
+        assert stats["categories"] == {
+            name: 2 if name == category else 0 for name in stats["categories"]
+        }
+
+    def test_category_order(self):
+        """Test that categories are reported in a fixed order."""
+        stats = emoji_extractor.get_emoji_stats(["🚀", "😀"])
+        assert list(stats["categories"]) == [
+            "faces", "animals", "objects", "symbols", "flags", "other"
+        ]
+
+    def test_no_emojis(self):
+        """Test the empty summary."""
+        assert emoji_extractor.get_emoji_stats([]) == {
+            "total": 0, "unique": 0, "most_common": [], "categories": {}
+        }
+
+    def test_stats(self):
+        """Test totals and most common emojis."""
+        stats = emoji_extractor.get_emoji_stats(["😀", "🐶", "😀"])
+        assert stats["total"] == 3
+        assert stats["unique"] == 2
+        assert stats["most_common"][0] == ("😀", 2)
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "no emoji here",
+        "😀😀 good dog 🐶 👍 ⚽ and 🚀",
+        "flags 🇺🇸🇮🇳 keycap 1️⃣ love ❤️ 😀",
+    ])
+    def test_extract_emoji_stats_matches_two_step(self, text):
+        """Test that the one-pass helper agrees with extract-then-count."""
+        assert emoji_extractor.extract_emoji_stats(text) == emoji_extractor.get_emoji_stats(
+            emoji_extractor.extract_emojis(text)
+        )
@@ -6,15 +6,8 @@ including platform detection, message parsing, and error handling.
 """
 
 import pytest
-import pandas as pd
-from datetime import datetime
 
-from whatsapp_analyzer.core.parser import (
-    parse_chat, detect_platform, _decode_file_content,
-    _clean_line, _is_android_format, _is_ios_format,
-    _parse_android_line, _parse_ios_line, _parse_timestamp,
-    ChatParseError, PlatformDetectionError
-)
+from whatsapp_analyzer.core import parser
 
 
 class TestPlatformDetection:
@@ -28,7 +21,7 @@ class TestPlatformDetection:
             "12/31/2023, 10:17 PM - Alice: How are you?",
         ]
         
-        platform = detect_platform(android_lines)
+        platform = parser.detect_platform(android_lines)
         assert platform == "android"
     
     def test_ios_detection(self):
@@ -39,7 +32,7 @@ class TestPlatformDetection:
             "[4/20/23, 4:21:59 AM] Sayantan: Bruh 🗿",
         ]
         
-        platform = detect_platform(ios_lines)
+        platform = parser.detect_platform(ios_lines)
         assert platform == "ios"
     
     def test_mixed_formats(self):
@@ -51,9 +44,18 @@ class TestPlatformDetection:
         ]
         
         # Should detect Android as it has more Android format lines
-        platform = detect_platform(mixed_lines)
+        platform = parser.detect_platform(mixed_lines)
         assert platform == "android"
     
+    def test_confident_early_exit(self):
+        """Test that detection stops once one platform clearly leads."""
+        lines = ["12/31/2023, 10:15 PM - Alice: Hello there!"] * 3 + [
+            "[4/20/23, 4:21:43 AM] Bob: Hi!",
+        ] * 10
+        
+        assert parser.detect_platform(lines, confidence=3) == "android"
+        assert parser.detect_platform(lines) == "ios"
+    
     def test_no_valid_formats(self):
         """Test detection with no valid format lines."""
         invalid_lines = [
@@ -62,8 +64,8 @@ class TestPlatformDetection:
             "Or this one",
         ]
         
-        with pytest.raises(PlatformDetectionError):
-            detect_platform(invalid_lines)
+        with pytest.raises(parser.PlatformDetectionError):
+            parser.detect_platform(invalid_lines)
 
 
 class TestLineParsing:
@@ -72,7 +74,7 @@ class TestLineParsing:
     def test_android_line_parsing(self):
         """Test Android line parsing."""
         line = "12/31/2023, 10:15 PM - Alice: Hello there!"
-        date, time, author, message = _parse_android_line(line)
+        date, time, author, message = parser._parse_android_line(line)
         
         assert date == "12/31/2023"
         assert time == "10:15 PM"
@@ -82,7 +84,7 @@ class TestLineParsing:
     def test_android_line_no_author(self):
         """Test Android line without author."""
         line = "12/31/2023, 10:15 PM - System message"
-        date, time, author, message = _parse_android_line(line)
+        date, time, author, message = parser._parse_android_line(line)
         
         assert date == "12/31/2023"
         assert time == "10:15 PM"
@@ -92,7 +94,7 @@ class TestLineParsing:
     def test_ios_line_parsing(self):
         """Test iOS line parsing."""
         line = "[4/20/23, 4:21:43 AM] Shrey Khandelwal: Ek kaam Karo..."
-        date, time, author, message = _parse_ios_line(line)
+        date, time, author, message = parser._parse_ios_line(line)
         
         assert date == "4/20/23"
         assert time == "4:21:43 AM"
@@ -102,7 +104,7 @@ class TestLineParsing:
     def test_ios_line_no_author(self):
         """Test iOS line without author."""
         line = "[4/20/23, 4:21:43 AM] System message"
-        date, time, author, message = _parse_ios_line(line)
+        date, time, author, message = parser._parse_ios_line(line)
         
         assert date == "4/20/23"
         assert time == "4:21:43 AM"
@@ -113,15 +115,15 @@ class TestLineParsing:
         """Test invalid Android line parsing."""
         line = "Invalid format line"
         
-        with pytest.raises(ChatParseError):
-            _parse_android_line(line)
+        with pytest.raises(parser.ChatParseError):
+            parser._parse_android_line(line)
     
     def test_invalid_ios_line(self):
         """Test invalid iOS line parsing."""
         line = "Invalid format line"
         
-        with pytest.raises(ChatParseError):
-            _parse_ios_line(line)
+        with pytest.raises(parser.ChatParseError):
+            parser._parse_ios_line(line)
 
 
 class TestFormatDetection:
@@ -130,18 +132,18 @@ class TestFormatDetection:
     def test_android_format_detection(self):
         """Test Android format detection."""
         valid_line = "12/31/2023, 10:15 PM - Alice: Hello!"
-        assert _is_android_format(valid_line) is True
+        assert parser._is_android_format(valid_line) is True
         
         invalid_line = "Not an Android format"
-        assert _is_android_format(invalid_line) is False
+        assert parser._is_android_format(invalid_line) is False
     
     def test_ios_format_detection(self):
         """Test iOS format detection."""
         valid_line = "[4/20/23, 4:21:43 AM] Alice: Hello!"
-        assert _is_ios_format(valid_line) is True
+        assert parser._is_ios_format(valid_line) is True
         
         invalid_line = "Not an iOS format"
-        assert _is_ios_format(invalid_line) is False
+        assert parser._is_ios_format(invalid_line) is False
 
 
 class TestTimestampParsing:
@@ -149,6 +151,8 @@ class TestTimestampParsing:
     
     def test_android_timestamp_parsing(self):
         """Test Android timestamp parsing."""
+        from datetime import datetime
+
         # Test various Android formats
         test_cases = [
             ("12/31/2023", "10:15 PM", "android"),
@@ -157,12 +161,14 @@ class TestTimestampParsing:
         ]
         
         for date, time, platform in test_cases:
-            timestamp = _parse_timestamp(date, time, platform)
+            timestamp = parser._parse_timestamp(date, time, platform)
             assert timestamp is not None
             assert isinstance(timestamp, datetime)
     
     def test_ios_timestamp_parsing(self):
         """Test iOS timestamp parsing."""
+        from datetime import datetime
+
         # Test various iOS formats
         test_cases = [
             ("4/20/23", "4:21:43 AM", "ios"),
@@ -171,14 +177,32 @@ class TestTimestampParsing:
         ]
         
         for date, time, platform in test_cases:
-            timestamp = _parse_timestamp(date, time, platform)
+            timestamp = parser._parse_timestamp(date, time, platform)
             assert timestamp is not None
             assert isinstance(timestamp, datetime)
     
+    def test_consistent_date_order(self):
+        """Test that ambiguous dates follow the format of the rest of the export."""
+        ios_chat = (
+            "[1/13/23, 9:00:00 AM] Alice: Hello!\n"
+            "[1/2/23, 9:00:00 AM] Bob: Hi!\n"
+            "[1/25/23, 9:00:00 AM] Alice: Bye!\n"
+        ).encode("utf-8")
+
+        df = parser.parse_chat(ios_chat, platform="ios")
+
+        assert df["ts"].dt.month.tolist() == [1, 1, 1]
+
     def test_invalid_timestamp(self):
         """Test invalid timestamp parsing."""
-        timestamp = _parse_timestamp("invalid", "time", "android")
+        timestamp = parser._parse_timestamp("invalid", "time", "android")
         assert timestamp is None
+    
+    def test_invalid_timestamp_is_quiet(self, caplog):
+        """Test that a single unparseable timestamp logs no warning."""
+        with caplog.at_level("WARNING"):
+            assert parser._parse_timestamp("31/31/2023", "10:15 PM", "android") is None
+        assert not caplog.records
 
 
 class TestFileContentDecoding:
@@ -187,7 +211,7 @@ class TestFileContentDecoding:
     def test_utf8_decoding(self):
         """Test UTF-8 decoding."""
         content = "Hello, world! 🌍".encode("utf-8")
-        lines = _decode_file_content(content)
+        lines = parser._decode_file_content(content)
         
         assert len(lines) == 1
         assert lines[0] == "Hello, world! 🌍"
@@ -195,7 +219,7 @@ class TestFileContentDecoding:
     def test_utf16_decoding(self):
         """Test UTF-16 decoding."""
         content = "Hello, world! 🌍".encode("utf-16")
-        lines = _decode_file_content(content)
+        lines = parser._decode_file_content(content)
         
         assert len(lines) == 1
         assert lines[0] == "Hello, world! 🌍"
@@ -204,7 +228,7 @@ class TestFileContentDecoding:
         """Test fallback decoding with errors."""
         # Create content with invalid bytes
         content = b"Hello\xff\xfe\x00world"
-        lines = _decode_file_content(content)
+        lines = parser._decode_file_content(content)
         
         assert len(lines) == 1
         assert "Hello" in lines[0]
@@ -217,14 +241,14 @@ class TestLineCleaning:
     def test_remove_directionality_marks(self):
         """Test removal of directionality marks."""
         line = "\u200eHello\u200f world"
-        cleaned = _clean_line(line)
+        cleaned = parser._clean_line(line)
         
         assert cleaned == "Hello world"
     
     def test_remove_bom(self):
         """Test removal of BOM characters."""
         line = "\ufeffHello world\n"
-        cleaned = _clean_line(line)
+        cleaned = parser._clean_line(line)
         
         assert cleaned == "Hello world"
 
@@ -240,7 +264,7 @@ class TestFullParsing:
             "12/31/2023, 10:17 PM - Alice: How are you?\n"
         ).encode("utf-8")
         
-        df = parse_chat(android_chat, platform="android")
+        df = parser.parse_chat(android_chat, platform="android")
         
         assert len(df) == 3
         assert list(df.columns) == ["Date", "Time", "Author", "Message", "ts", "date", "hour", "dow", "is_media"]
@@ -255,7 +279,7 @@ class TestFullParsing:
             "[4/20/23, 4:21:59 AM] Sayantan: Bruh 🗿\n"
         ).encode("utf-8")
         
-        df = parse_chat(ios_chat, platform="ios")
+        df = parser.parse_chat(ios_chat, platform="ios")
         
         assert len(df) == 3
         assert list(df.columns) == ["Date", "Time", "Author", "Message", "ts", "date", "hour", "dow", "is_media"]
@@ -269,11 +293,26 @@ class TestFullParsing:
             "12/31/2023, 10:16 PM - Bob: Hi Alice!\n"
         ).encode("utf-8")
         
-        df = parse_chat(android_chat, platform="auto")
+        df = parser.parse_chat(android_chat, platform="auto")
         
         assert len(df) == 2
         assert df["Author"].iloc[0] == "Alice"
     
+    def test_file_path_parsing(self, tmp_path):
+        """Test parsing a chat export from a file path."""
+        chat_file = tmp_path / "chat.txt"
+        chat_file.write_bytes((
+            "12/31/2023, 10:15 PM - Alice: Hello there!\n"
+            "12/31/2023, 10:16 PM - Bob: Hi Alice!\n"
+        ).encode("utf-16"))
+        
+        df = parser.parse_chat(chat_file)
+        
+        assert len(df) == 2
+        assert df["Author"].iloc[1] == "Bob"
+        assert df["Message"].iloc[0] == "Hello there!"
+        assert df.equals(parser.parse_chat_path(str(chat_file), chunksize=16))
+    
     def test_multiline_messages(self):
         """Test parsing of multiline messages."""
         chat_with_multiline = (
@@ -283,7 +322,7 @@ class TestFullParsing:
             "12/31/2023, 10:16 PM - Bob: Hi Alice!\n"
         ).encode("utf-8")
         
-        df = parse_chat(chat_with_multiline, platform="android")
+        df = parser.parse_chat(chat_with_multiline, platform="android")
         
         assert len(df) == 2
         assert "continuation" in df["Message"].iloc[0]
@@ -297,13 +336,67 @@ class TestFullParsing:
             "12/31/2023, 10:17 PM - Alice: Nice photo!\n"
         ).encode("utf-8")
         
-        df = parse_chat(chat_with_media, platform="android")
+        df = parser.parse_chat(chat_with_media, platform="android")
         
         assert len(df) == 3
         assert df["is_media"].iloc[1] is True
         assert df["is_media"].iloc[0] is False
         assert df["is_media"].iloc[2] is False
 
+    def test_ios_media_placeholders(self):
+        """Test that iOS media placeholders are flagged, not ordinary text."""
+        ios_chat = (
+            "[4/20/23, 4:21:43 AM] Alice: \u200eimage omitted\n"
+            "[4/20/23, 4:21:55 AM] Bob: notes.pdf • \u200e3 pages \u200edocument omitted\n"
+            "[4/20/23, 4:21:59 AM] Alice: See the details above\n"
+        ).encode("utf-8")
+        
+        df = parser.parse_chat(ios_chat, platform="ios")
+        
+        assert df["is_media"].tolist() == [True, True, False]
+
+    @pytest.mark.parametrize("placeholder", ["<Media omitted>", "<media omitted>", "<MEDIA OMITTED>"])
+    def test_android_media_placeholder_case(self, placeholder):
+        """Test that the Android placeholder is flagged in any letter case."""
+        chat_with_media = (
+            "12/31/2023, 10:15 PM - Alice: Hello there!\n"
+            f"12/31/2023, 10:16 PM - Bob: {placeholder}\n"
+        ).encode("utf-8")
+        
+        df = parser.parse_chat(chat_with_media, platform="android")
+        assert df["is_media"].tolist() == [False, True]
+
+        df = parser.parse_chat(chat_with_media, platform="android", skip_media=True)
+        assert df["Message"].tolist() == ["Hello there!"]
+
+    def test_skip_media(self):
+        """Test that media messages can be dropped while parsing."""
+        chat_with_media = (
+            "12/31/2023, 10:15 PM - Alice: Hello there!\n"
+            "12/31/2023, 10:16 PM - Bob: <Media omitted>\n"
+            "12/31/2023, 10:17 PM - Alice: Nice photo!\n"
+        ).encode("utf-8")
+        
+        df = parser.parse_chat(chat_with_media, platform="android", skip_media=True)
+        
+        assert df["Message"].tolist() == ["Hello there!", "Nice photo!"]
+        assert df["Author"].tolist() == ["Alice", "Alice"]
+        assert not df["is_media"].any()
+
+    def test_categorical_columns(self):
+        """Test that Author and dow are stored as categoricals."""
+        android_chat = (
+            "12/31/2023, 10:15 PM - Alice: Hello there!\n"
+            "1/1/2024, 10:16 AM - Bob: Hi Alice!\n"
+        ).encode("utf-8")
+
+        df = parser.parse_chat(android_chat, platform="android")
+
+        assert df["Author"].dtype == "category"
+        assert df["dow"].cat.ordered
+        assert list(df["dow"].cat.categories) == list(parser.DAYS_OF_WEEK)
+        assert df["dow"].tolist() == ["Sunday", "Monday"]
+
 
 class TestErrorHandling:
     """Test error handling functionality."""
@@ -312,22 +405,22 @@ class TestErrorHandling:
         """Test handling of empty content."""
         empty_content = b""
         
-        with pytest.raises(ChatParseError):
-            parse_chat(empty_content, platform="android")
+        with pytest.raises(parser.ChatParseError):
+            parser.parse_chat(empty_content, platform="android")
     
     def test_no_valid_messages(self):
         """Test handling of content with no valid messages."""
         invalid_content = "This is not a valid chat format\n".encode("utf-8")
         
-        with pytest.raises(ChatParseError):
-            parse_chat(invalid_content, platform="android")
+        with pytest.raises(parser.ChatParseError):
+            parser.parse_chat(invalid_content, platform="android")
     
     def test_invalid_platform(self):
         """Test handling of invalid platform."""
         valid_content = "12/31/2023, 10:15 PM - Alice: Hello!".encode("utf-8")
         
         with pytest.raises(ValueError):
-            parse_chat(valid_content, platform="invalid_platform")
+            parser.parse_chat(valid_content, platform="invalid_platform")
 
 
 class TestEdgeCases:
@@ -337,7 +430,7 @@ class TestEdgeCases:
         """Test parsing of single message."""
         single_message = "12/31/2023, 10:15 PM - Alice: Hello!".encode("utf-8")
         
-        df = parse_chat(single_message, platform="android")
+        df = parser.parse_chat(single_message, platform="android")
         
         assert len(df) == 1
         assert df["Author"].iloc[0] == "Alice"
@@ -349,7 +442,7 @@ class TestEdgeCases:
             "12/31/2023, 10:16 PM - Bob: Hi! 🌍\n"
         ).encode("utf-8")
         
-        df = parse_chat(special_chars, platform="android")
+        df = parser.parse_chat(special_chars, platform="android")
         
         assert len(df) == 2
         assert "😀" in df["Message"].iloc[0]
@@ -363,7 +456,7 @@ class TestEdgeCases:
             "1/1/23, 9:30 AM - Charlie: Short year\n"
         ).encode("utf-8")
         
-        df = parse_chat(date_formats, platform="android")
+        df = parser.parse_chat(date_formats, platform="android")
         
         assert len(df) == 3
         assert all(df["ts"].notna())  # All timestamps should be parsed successfully 
\ No newline at end of file
@@ -5,16 +5,40 @@ This package provides functionality to parse and analyze WhatsApp chat exports
 from both Android and iOS platforms, with support for Streamlit UI and CLI interfaces.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "WhatsApp Chat Analyzer Team"
 
-from .core.parser import parse_chat, detect_platform
-from .core.analyzer import ChatAnalyzer
-from .utils.emoji_extractor import extract_emojis
+# Public symbols are resolved on first access (PEP 562) so that importing the
+# package does not pull in pandas, plotly and the analyzer stack up front.
+_LAZY = {
+    "parse_chat": ("whatsapp_analyzer.core.parser", "parse_chat"),
+    "parse_chat_path": ("whatsapp_analyzer.core.parser", "parse_chat_path"),
+    "detect_platform": ("whatsapp_analyzer.core.parser", "detect_platform"),
+    "ChatAnalyzer": ("whatsapp_analyzer.core.analyzer", "ChatAnalyzer"),
+    "extract_emojis": ("whatsapp_analyzer.utils.emoji_extractor", "extract_emojis"),
+}
 
 __all__ = [
     "parse_chat",
+    "parse_chat_path",
     "detect_platform", 
     "ChatAnalyzer",
     "extract_emojis",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve lazily exported symbols on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -6,15 +6,20 @@ without requiring a web interface.
 """
 
 import argparse
-import json
+import functools
+import itertools
 import logging
+import os
+import stat
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
 
 from .core.parser import parse_chat, detect_platform, ChatParseError, PlatformDetectionError
 from .core.analyzer import ChatAnalyzer
-from .utils.emoji_extractor import extract_emojis
+from .config import get_max_file_size
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +28,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer the C-implemented orjson encoder for JSON exports, fallback to json
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    orjson = None
+    USING_ORJSON = False
+
+# Chunk size used when streaming chat exports from files or stdin
+READ_CHUNK_SIZE = 1 << 20
+
+# Rows per record batch when writing CSV exports with pyarrow
+CSV_BATCH_SIZE = 65536
+
+# Built-in demo exports, encoded once at import
+_DEMO_IOS = (
+    "[4/20/23,\u202f4:21:43\u202fAM] 343: \u200eMessages and calls are end-to-end encrypted.\n"
+    "[4/20/23,\u202f4:21:55\u202fAM] Shrey Khandelwal: Ek kaam Karo...\n"
+    "[4/20/23,\u202f4:21:59\u202fAM] Sayantan: Bruh 🗿\n"
+).encode("utf-8")
+
+_DEMO_ANDROID = (
+    "12/31/2023, 10:15 PM - Alice: Happy New Year 😀\n"
+    "12/31/2023, 10:16 PM - Bob: Same to you!\n"
+    "12/31/2023, 10:17 PM - Alice: <Media omitted>\n"
+).encode("utf-8")
+
 
 def setup_logging(verbose: bool = False, debug: bool = False) -> None:
     """Configure logging based on verbosity flags."""
@@ -34,37 +66,125 @@ def setup_logging(verbose: bool = False, debug: bool = False) -> None:
         logging.getLogger().setLevel(logging.WARNING)
 
 
-def read_input_file(file_path: str) -> bytes:
+def check_input_file(file_path: str) -> int:
     """
-    Read file content from the specified path.
+    Validate an input path and its size before anything is read.
     
     Args:
-        file_path: Path to the file to read
+        file_path: Path to the file to check
         
     Returns:
-        File content as bytes
+        File size in bytes
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        PermissionError: If file can't be read
+        ValueError: If the path is not a file or exceeds the configured size limit
     """
+    path = Path(file_path)
     try:
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        if not path.is_file():
-            raise ValueError(f"Path is not a file: {file_path}")
-        
-        with open(path, 'rb') as f:
-            content = f.read()
+        info = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    if not stat.S_ISREG(info.st_mode):
+        raise ValueError(f"Path is not a file: {file_path}")
+    
+    limit = get_max_file_size() * 1024 * 1024
+    if info.st_size > limit:
+        raise ValueError(f"File is {info.st_size} bytes, exceeding the {limit} byte limit: {file_path}")
+    
+    return info.st_size
+
+
+def read_input_file_chunked(file_path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterable[bytes]:
+    """
+    Stream file content from the specified path in fixed-size chunks.
+    
+    The path is validated eagerly so missing files are reported before
+    any parsing starts; the chunks themselves are read lazily.
+    
+    Args:
+        file_path: Path to the file to read
+        chunk_size: Maximum number of bytes per chunk
         
-        logger.info(f"Successfully read {len(content)} bytes from {file_path}")
-        return content
+    Returns:
+        Iterator over the file content as byte chunks, or an empty
+        (falsy) tuple if the file is empty
         
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the path is not a file or exceeds the configured size limit
+    """
+    try:
+        size = check_input_file(file_path)
     except Exception as e:
         logger.error(f"Failed to read file {file_path}: {e}")
         raise
+    
+    if not size:
+        logger.warning(f"File {file_path} is empty")
+        return ()
+    
+    logger.info(f"Streaming {size} bytes from {file_path}")
+    return _iter_file_chunks(Path(file_path), chunk_size)
+
+
+def read_input_file(file_path: str) -> bytes:
+    """
+    Read file content from the specified path.
+    
+    Args:
+        file_path: Path to the file to read
+        
+    Returns:
+        File content as bytes
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the path is not a file or exceeds the configured size limit
+    """
+    return b"".join(read_input_file_chunked(file_path))
+
+
+def _iter_file_chunks(path: Path, chunk_size: int) -> Iterator[bytes]:
+    """Yield raw chunks from an unbuffered file descriptor."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Sequential access widens read-ahead; WILLNEED starts
+            # asynchronous page-cache population for the whole file so disk
+            # reads overlap with parsing of earlier chunks.
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        while True:
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        os.close(fd)
+
+
+def read_stdin_chunked(chunk_size: int = READ_CHUNK_SIZE) -> Iterable[bytes]:
+    """
+    Stream content from standard input in fixed-size chunks.
+    
+    The first chunk is read eagerly so that empty input is detected before
+    any parsing starts.
+    
+    Args:
+        chunk_size: Maximum number of bytes per chunk
+        
+    Returns:
+        Iterator over stdin content as byte chunks, or an empty (falsy)
+        tuple if stdin is empty
+    """
+    read = functools.partial(sys.stdin.buffer.read, chunk_size)
+    first = read()
+    if not first:
+        logger.warning("No content received from stdin")
+        return ()
+    return itertools.chain((first,), iter(read, b""))
 
 
 def read_stdin() -> bytes:
@@ -74,16 +194,7 @@ def read_stdin() -> bytes:
     Returns:
         Content from stdin as bytes
     """
-    try:
-        content = sys.stdin.buffer.read()
-        if not content:
-            logger.warning("No content received from stdin")
-        else:
-            logger.info(f"Successfully read {len(content)} bytes from stdin")
-        return content
-    except Exception as e:
-        logger.error(f"Failed to read from stdin: {e}")
-        raise
+    return b"".join(read_stdin_chunked())
 
 
 def get_demo_data(platform: str) -> bytes:
@@ -96,46 +207,37 @@ def get_demo_data(platform: str) -> bytes:
     Returns:
         Demo chat data as bytes
     """
-    if platform == "ios":
-        demo_data = (
-            "[4/20/23,\u202f4:21:43\u202fAM] 343: \u200eMessages and calls are end-to-end encrypted.\n"
-            "[4/20/23,\u202f4:21:55\u202fAM] Shrey Khandelwal: Ek kaam Karo...\n"
-            "[4/20/23,\u202f4:21:59\u202fAM] Sayantan: Bruh 🗿\n"
-        ).encode("utf-8")
-    else:  # android
-        demo_data = (
-            "12/31/2023, 10:15 PM - Alice: Happy New Year 😀\n"
-            "12/31/2023, 10:16 PM - Bob: Same to you!\n"
-            "12/31/2023, 10:17 PM - Alice: <Media omitted>\n"
-        ).encode("utf-8")
-    
+    demo_data = _DEMO_IOS if platform == "ios" else _DEMO_ANDROID
     logger.info(f"Using demo data for {platform} platform")
     return demo_data
 
 
-def analyze_chat(chat_data: bytes, platform: str, include_media: bool = False) -> ChatAnalyzer:
+def analyze_chat(
+    chat_data: Union[bytes, Iterable[bytes]],
+    platform: str,
+    include_media: bool = False,
+    n_jobs: int = 1
+) -> ChatAnalyzer:
     """
     Parse and analyze chat data.
     
     Args:
-        chat_data: Raw chat data
+        chat_data: Raw chat data, either whole or as an iterable of byte chunks
         platform: Platform identifier
         include_media: Whether to include media messages
+        n_jobs: Worker processes for sentiment scoring (-1 for all CPUs)
         
     Returns:
         ChatAnalyzer instance with parsed data
     """
     try:
-        # Parse chat data
-        df = parse_chat(chat_data, platform=platform)
-        
-        # Filter media if requested
+        # Parse chat data, dropping media messages during parsing unless requested
+        df = parse_chat(chat_data, platform=platform, skip_media=not include_media)
         if not include_media:
-            df = df[~df["is_media"]]
-            logger.info(f"Filtered out media messages, {len(df)} text messages remaining")
+            logger.info(f"Skipped media messages, {len(df)} text messages parsed")
         
         # Create analyzer
-        analyzer = ChatAnalyzer(df)
+        analyzer = ChatAnalyzer(df, n_jobs=n_jobs)
         return analyzer
         
     except (ChatParseError, PlatformDetectionError) as e:
@@ -146,139 +248,280 @@ def analyze_chat(chat_data: bytes, platform: str, include_media: bool = False) -
         raise
 
 
-def print_basic_stats(analyzer: ChatAnalyzer) -> None:
-    """Print basic statistics to stdout."""
+def format_basic_stats(analyzer: ChatAnalyzer) -> str:
+    """Format basic statistics as a report section."""
     stats = analyzer.get_basic_stats()
+    date_range = stats["date_range"]
+    rule = "=" * 50
     
-    print("\n" + "="*50)
-    print("📊 BASIC STATISTICS")
-    print("="*50)
-    print(f"Total Messages: {stats['total_messages']:,}")
-    print(f"Participants: {stats['total_participants']}")
-    print(f"Days Active: {stats['days_active']}")
-    print(f"Date Range: {stats['date_range']['start']} → {stats['date_range']['end']}")
-    print(f"Total Words: {stats['total_words']:,}")
-    print(f"Total Characters: {stats['total_characters']:,}")
-    print(f"Media Messages: {stats['media_messages']}")
-    print(f"Text Messages: {stats['text_messages']}")
-    print(f"Avg Words/Message: {stats['avg_words_per_message']}")
-    print(f"Avg Chars/Message: {stats['avg_chars_per_message']}")
+    return (
+        f"\n{rule}\n"
+        f"📊 BASIC STATISTICS\n"
+        f"{rule}\n"
+        f"Total Messages: {stats['total_messages']:,}\n"
+        f"Participants: {stats['total_participants']}\n"
+        f"Days Active: {stats['days_active']}\n"
+        f"Date Range: {date_range['start']} → {date_range['end']}\n"
+        f"Avg Words/Message: {stats['avg_words_per_message']}\n"
+    )
 
 
-def print_participant_stats(analyzer: ChatAnalyzer, top_n: int = 10) -> None:
-    """Print participant statistics to stdout."""
+def format_participant_stats(analyzer: ChatAnalyzer, top_n: int = 10) -> str:
+    """Format participant statistics as a report section."""
     participant_stats = analyzer.get_participant_stats()
     
-    print("\n" + "="*50)
-    print(f"👥 TOP {top_n} PARTICIPANTS")
-    print("="*50)
+    lines = [
+        "\n" + "="*50,
+        f"👥 TOP {top_n} PARTICIPANTS",
+        "="*50,
+    ]
     
     top_participants = participant_stats.head(top_n)
     
-    for i, (participant, stats) in enumerate(top_participants.iterrows(), 1):
-        print(f"\n{i}. {participant}")
-        print(f"   Messages: {stats['message_count']:,}")
-        print(f"   Words: {stats['total_words']:,}")
-        print(f"   Avg Words/Message: {stats['avg_words_per_message']}")
-        print(f"   Activity Period: {stats['activity_days']} days")
-
-
-def print_activity_patterns(analyzer: ChatAnalyzer) -> None:
-    """Print activity pattern analysis to stdout."""
-    print("\n" + "="*50)
-    print("⏰ ACTIVITY PATTERNS")
-    print("="*50)
+    # Read whole columns once instead of boxing every row into a Series
+    participants = top_participants.index.to_numpy()
+    messages = top_participants["messages"].to_numpy()
+    words = top_participants["words"].to_numpy()
+    avg_words = top_participants["avg_words"].to_numpy()
+    
+    for i in range(len(participants)):
+        lines.append(f"\n{i + 1}. {participants[i]}")
+        lines.append(f"   Messages: {messages[i]:,}")
+        lines.append(f"   Words: {words[i]:,}")
+        lines.append(f"   Avg Words/Message: {avg_words[i]}")
+    return "\n".join(lines) + "\n"
+
+
+def format_activity_patterns(analyzer: ChatAnalyzer) -> str:
+    """Format activity pattern analysis as a report section."""
+    lines = [
+        "\n" + "="*50,
+        "⏰ ACTIVITY PATTERNS",
+        "="*50,
+    ]
     
     # Hourly activity
     hourly = analyzer.get_hourly_activity()
     peak_hour = hourly.idxmax()
     peak_count = hourly.max()
-    print(f"\nPeak Activity Hour: {peak_hour}:00 ({peak_count} messages)")
+    lines.append(f"\nPeak Activity Hour: {peak_hour}:00 ({peak_count} messages)")
     
     # Daily activity
     daily = analyzer.get_daily_activity()
     peak_day = daily.idxmax()
     peak_day_count = daily.max()
-    print(f"Peak Activity Day: {peak_day} ({peak_day_count} messages)")
+    lines.append(f"Peak Activity Day: {peak_day} ({peak_day_count} messages)")
     
     # Date activity
     date_activity = analyzer.get_date_activity()
     if not date_activity.empty:
         busiest_date = date_activity.idxmax()
         busiest_count = date_activity.max()
-        print(f"Busiest Date: {busiest_date} ({busiest_count} messages)")
+        lines.append(f"Busiest Date: {busiest_date:%Y-%m-%d} ({busiest_count} messages)")
+    return "\n".join(lines) + "\n"
 
 
-def print_response_analysis(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> None:
-    """Print response time analysis to stdout."""
+def format_response_analysis(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> str:
+    """Format response time analysis as a report section."""
     try:
         response_times = analyzer.get_response_times(threshold_hours)
         
-        if not response_times.empty:
-            print("\n" + "="*50)
-            print(f"⚡ RESPONSE TIME ANALYSIS (>={threshold_hours}h gap)")
-            print("="*50)
-            
-            fastest_responder = response_times.index[0]
-            fastest_time = response_times.iloc[0]
-            print(f"\nFastest Responder: {fastest_responder}")
-            print(f"Average Response Time: {fastest_time:.0f} seconds")
-            
-            if len(response_times) > 1:
-                slowest_responder = response_times.index[-1]
-                slowest_time = response_times.iloc[-1]
-                print(f"Slowest Responder: {slowest_responder}")
-                print(f"Average Response Time: {slowest_time:.0f} seconds")
-        else:
-            print(f"\nNo response time data available for {threshold_hours}h threshold")
+        if response_times.empty:
+            return f"\nNo response time data available for {threshold_hours}h threshold\n"
+        
+        lines = [
+            "\n" + "="*50,
+            f"⚡ RESPONSE TIME ANALYSIS (>={threshold_hours}h gap)",
+            "="*50,
+        ]
+        
+        fastest_responder = response_times.index[0]
+        fastest_time = response_times.iloc[0]
+        lines.append(f"\nFastest Responder: {fastest_responder}")
+        lines.append(f"Average Response Time: {fastest_time:.0f} seconds")
+        
+        if len(response_times) > 1:
+            slowest_responder = response_times.index[-1]
+            slowest_time = response_times.iloc[-1]
+            lines.append(f"Slowest Responder: {slowest_responder}")
+            lines.append(f"Average Response Time: {slowest_time:.0f} seconds")
+        return "\n".join(lines) + "\n"
             
     except Exception as e:
         logger.warning(f"Could not analyze response times: {e}")
+        return ""
 
 
-def print_conversation_starters(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> None:
-    """Print conversation starter analysis to stdout."""
+def format_conversation_starters(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> str:
+    """Format conversation starter analysis as a report section."""
     try:
         starters = analyzer.get_conversation_starters(threshold_hours)
         
-        if not starters.empty:
-            print("\n" + "="*50)
-            print(f"💬 CONVERSATION STARTERS (>={threshold_hours}h gap)")
-            print("="*50)
-            
-            for i, (participant, count) in enumerate(starters.head(5).items(), 1):
-                print(f"{i}. {participant}: {count} conversations started")
-        else:
-            print(f"\nNo conversation starter data available for {threshold_hours}h threshold")
+        if starters.empty:
+            return f"\nNo conversation starter data available for {threshold_hours}h threshold\n"
+        
+        lines = [
+            "\n" + "="*50,
+            f"💬 CONVERSATION STARTERS (>={threshold_hours}h gap)",
+            "="*50,
+        ]
+        
+        for i, (participant, count) in enumerate(starters.head(5).items(), 1):
+            lines.append(f"{i}. {participant}: {count} conversations started")
+        return "\n".join(lines) + "\n"
             
     except Exception as e:
         logger.warning(f"Could not analyze conversation starters: {e}")
+        return ""
 
 
-def print_emoji_analysis(analyzer: ChatAnalyzer) -> None:
-    """Print emoji analysis to stdout."""
+def format_emoji_analysis(analyzer: ChatAnalyzer) -> str:
+    """Format emoji analysis as a report section."""
+    # Deferred so runs that skip this section never load the emoji tables
+    from .utils.emoji_extractor import extract_emojis
+    
     try:
         emoji_analysis = analyzer.get_emoji_analysis(extract_emojis)
         
-        if emoji_analysis["total_emojis"] > 0:
-            print("\n" + "="*50)
-            print("😀 EMOJI ANALYSIS")
-            print("="*50)
-            print(f"Total Emojis: {emoji_analysis['total_emojis']:,}")
-            print(f"Unique Emojis: {emoji_analysis['unique_emojis']}")
-            
-            if emoji_analysis["top_emojis"]:
-                print("\nTop 10 Emojis:")
-                for emoji, count in emoji_analysis["top_emojis"][:10]:
-                    print(f"  {emoji}  x{count}")
-        else:
-            print("\nNo emojis found in the chat")
+        if emoji_analysis["total_emojis"] == 0:
+            return "\nNo emojis found in the chat\n"
+        
+        lines = [
+            "\n" + "="*50,
+            "😀 EMOJI ANALYSIS",
+            "="*50,
+            f"Total Emojis: {emoji_analysis['total_emojis']:,}",
+            f"Unique Emojis: {emoji_analysis['unique_emojis']}",
+        ]
+        
+        if emoji_analysis["top_emojis"]:
+            lines.append("\nTop 10 Emojis:")
+            for emoji, count in emoji_analysis["top_emojis"][:10]:
+                lines.append(f"  {emoji}  x{count}")
+        return "\n".join(lines) + "\n"
             
     except Exception as e:
         logger.warning(f"Could not analyze emojis: {e}")
+        return ""
+
+
+def write_report(text: str) -> None:
+    """
+    Write report text to stdout as UTF-8 bytes.
+    
+    Encoding each section once and writing it to the binary buffer skips
+    the text layer's per-write encode and keeps emoji output intact on
+    consoles whose locale codec can't represent them.
+    
+    Args:
+        text: Formatted report section
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. io.StringIO)
+        sys.stdout.write(text)
+        return
+    
+    # Flush pending text output first so sections stay in order with print()
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8", errors="replace"))
+    buffer.flush()
+
+
+def print_basic_stats(analyzer: ChatAnalyzer) -> None:
+    """Print basic statistics to stdout."""
+    write_report(format_basic_stats(analyzer))
+
+
+def print_participant_stats(analyzer: ChatAnalyzer, top_n: int = 10) -> None:
+    """Print participant statistics to stdout."""
+    write_report(format_participant_stats(analyzer, top_n))
+
+
+def print_activity_patterns(analyzer: ChatAnalyzer) -> None:
+    """Print activity pattern analysis to stdout."""
+    write_report(format_activity_patterns(analyzer))
+
+
+def print_response_analysis(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> None:
+    """Print response time analysis to stdout."""
+    write_report(format_response_analysis(analyzer, threshold_hours))
+
+
+def print_conversation_starters(analyzer: ChatAnalyzer, threshold_hours: int = 1) -> None:
+    """Print conversation starter analysis to stdout."""
+    write_report(format_conversation_starters(analyzer, threshold_hours))
+
+
+def print_emoji_analysis(analyzer: ChatAnalyzer) -> None:
+    """Print emoji analysis to stdout."""
+    write_report(format_emoji_analysis(analyzer))
 
 
-def export_results(analyzer: ChatAnalyzer, output_path: str, format_type: str = "excel") -> None:
+# Report sections in print order, keyed by their --sections name
+SECTION_FORMATTERS: Dict[str, Callable[[ChatAnalyzer, int], str]] = {
+    "basic": lambda analyzer, threshold_hours: format_basic_stats(analyzer),
+    "participants": lambda analyzer, threshold_hours: format_participant_stats(analyzer),
+    "activity": lambda analyzer, threshold_hours: format_activity_patterns(analyzer),
+    "response": format_response_analysis,
+    "starters": format_conversation_starters,
+    "emoji": lambda analyzer, threshold_hours: format_emoji_analysis(analyzer),
+}
+
+
+def print_sections(analyzer: ChatAnalyzer, sections: List[str], threshold_hours: int = 1) -> None:
+    """
+    Print the selected report sections to stdout.
+    
+    Only the requested sections are computed; the rest cost nothing.
+    Sections are formatted and written one at a time, in report order.
+    
+    Args:
+        analyzer: ChatAnalyzer instance
+        sections: Section names from SECTION_FORMATTERS, or 'all'
+        threshold_hours: Conversation gap used by the response/starter sections
+    """
+    selected = set(SECTION_FORMATTERS) if "all" in sections else set(sections)
+    formatters = [fmt for name, fmt in SECTION_FORMATTERS.items() if name in selected]
+    for formatter in formatters:
+        write_report(formatter(analyzer, threshold_hours))
+
+
+def write_csv(df: pd.DataFrame, csv_path: str) -> None:
+    """
+    Write a DataFrame to CSV without its index.
+    
+    Uses pyarrow's multi-threaded batched writer when it is installed and
+    can convert the frame, otherwise falls back to DataFrame.to_csv.
+    
+    Args:
+        df: DataFrame to write
+        csv_path: Destination file path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(csv_path, index=False)
+        return
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException as e:
+        logger.debug(f"pyarrow could not convert chat data, using pandas writer: {e}")
+        df.to_csv(csv_path, index=False)
+        return
+    
+    write_options = pacsv.WriteOptions(batch_size=CSV_BATCH_SIZE)
+    pacsv.write_csv(table, csv_path, write_options=write_options)
+
+
+def export_results(
+    analyzer: ChatAnalyzer,
+    output_path: str,
+    format_type: str = "excel",
+    columns: Optional[List[str]] = None
+) -> None:
     """
     Export analysis results to file.
     
@@ -286,6 +529,10 @@ def export_results(analyzer: ChatAnalyzer, output_path: str, format_type: str =
         analyzer: ChatAnalyzer instance
         output_path: Path to save results
         format_type: Export format ('excel', 'csv', 'json')
+        columns: Chat data columns to write for CSV exports (default: all)
+        
+    Raises:
+        ValueError: If columns names a column the chat data doesn't have
     """
     try:
         if format_type == "excel":
@@ -293,15 +540,31 @@ def export_results(analyzer: ChatAnalyzer, output_path: str, format_type: str =
             print(f"\n📊 Analysis report exported to: {output_path}")
         elif format_type == "csv":
             # Export main data
-            csv_path = output_path.replace('.xlsx', '.csv')
-            analyzer.chat_data.to_csv(csv_path, index=False)
+            csv_path = str(Path(output_path).with_suffix('.csv'))
+            chat_data = analyzer.chat_data
+            if columns:
+                # Project first so unwanted columns are never formatted
+                unknown = [column for column in columns if column not in chat_data.columns]
+                if unknown:
+                    raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+                chat_data = chat_data[columns]
+            write_csv(chat_data, csv_path)
             print(f"\n📊 Chat data exported to: {csv_path}")
         elif format_type == "json":
             # Export insights as JSON
-            json_path = output_path.replace('.xlsx', '.json')
+            json_path = str(Path(output_path).with_suffix('.json'))
             insights = analyzer.get_all_insights()
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(insights, f, indent=2, default=str, ensure_ascii=False)
+            if USING_ORJSON:
+                options = (
+                    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+                with open(json_path, 'wb') as f:
+                    f.write(orjson.dumps(insights, option=options, default=str))
+            else:
+                import json
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(insights, f, indent=2, default=str, ensure_ascii=False)
             print(f"\n📊 Analysis insights exported to: {json_path}")
             
     except Exception as e:
@@ -309,9 +572,11 @@ def export_results(analyzer: ChatAnalyzer, output_path: str, format_type: str =
         raise
 
 
-def main() -> int:
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once and reuse it across main() calls."""
     parser = argparse.ArgumentParser(
+        prog="whatsapp-analyzer",
         description="WhatsApp Chat Analyzer - Command Line Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -325,6 +590,9 @@ Examples:
   # Read from stdin and export to Excel
   cat chat.txt | whatsapp-analyzer --stdin --export report.xlsx
   
+  # Print only the activity and emoji sections
+  whatsapp-analyzer --file chat.txt --sections activity emoji
+  
   # Verbose output with debug info
   whatsapp-analyzer --file chat.txt --verbose --debug
         """
@@ -366,8 +634,21 @@ Examples:
         default=1,
         help="Hours of inactivity to consider as new conversation (default: 1)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for sentiment scoring; -1 uses all CPUs (default: 1)"
+    )
     
     # Output options
+    parser.add_argument(
+        "--sections",
+        nargs="+",
+        choices=[*SECTION_FORMATTERS, "all"],
+        default=None,
+        help="Report sections to print (default: all, or none when exporting)"
+    )
     parser.add_argument(
         "--export", "-o",
         type=str,
@@ -379,6 +660,11 @@ Examples:
         default="excel",
         help="Export format when using --export (default: excel)"
     )
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        help="Chat data columns to include in a CSV export (default: all)"
+    )
     
     # Control options
     parser.add_argument(
@@ -397,7 +683,29 @@ Examples:
         help="Suppress all output except errors"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command-line arguments without the program name
+            (defaults to sys.argv[1:])
+        
+    Returns:
+        Process exit code
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.columns and args.format != "csv":
+        parser.error("--columns only applies to --format csv")
+    
+    # Report sections are written as UTF-8 bytes; keep print() output consistent.
+    # Replaced streams (pytest capture, IDE consoles, StringIO) may lack reconfigure
+    if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
     
     # Setup logging
     setup_logging(args.verbose, args.debug)
@@ -410,29 +718,27 @@ Examples:
         if args.demo:
             chat_data = get_demo_data(args.platform if args.platform != "auto" else "android")
         elif args.stdin:
-            chat_data = read_stdin()
+            chat_data = read_stdin_chunked()
         else:
-            chat_data = read_input_file(args.file)
+            chat_data = read_input_file_chunked(args.file)
         
         if not chat_data:
             logger.error("No chat data available for analysis")
             return 1
         
         # Analyze chat
-        analyzer = analyze_chat(chat_data, args.platform, args.include_media)
+        analyzer = analyze_chat(chat_data, args.platform, args.include_media, args.jobs)
         
-        # Print analysis results
+        # Print analysis results; an export on its own prints nothing
+        sections = args.sections
+        if sections is None:
+            sections = [] if args.export else ["all"]
         if not args.quiet:
-            print_basic_stats(analyzer)
-            print_participant_stats(analyzer)
-            print_activity_patterns(analyzer)
-            print_response_analysis(analyzer, args.threshold_hours)
-            print_conversation_starters(analyzer, args.threshold_hours)
-            print_emoji_analysis(analyzer)
+            print_sections(analyzer, sections, args.threshold_hours)
         
         # Export results if requested
         if args.export:
-            export_results(analyzer, args.export, args.format)
+            export_results(analyzer, args.export, args.format, args.columns)
         
         return 0
         
@@ -14,7 +14,7 @@ DEFAULT_CONFIG = {
     "logging_level": "INFO",
     "log_file": None,
     "max_file_size_mb": 100,
-    "supported_encodings": ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be"],
+    "supported_encodings": ("utf-8", "utf-8-sig", "utf-16", "utf-32"),
     "default_platform": "auto",
     "conversation_threshold_hours": 1,
     "max_messages_preview": 200,
@@ -37,6 +37,47 @@ ENV_MAPPINGS = {
 }
 
 
+# Environment values (lowercased) that enable a boolean setting
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable string as a boolean flag."""
+    return value.lower() in _TRUTHY
+
+
+# Type converters for environment values; unlisted keys stay strings
+_CONVERTERS = {
+    "debug_mode": _to_bool,
+    "anonymize_default": _to_bool,
+    "include_media_default": _to_bool,
+    "max_file_size_mb": int,
+    "conversation_threshold_hours": int,
+    "max_messages_preview": int,
+}
+
+# Logging levels accepted by Config.validate
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+def _is_positive_number(value: Any) -> bool:
+    """Check that a setting is a number greater than zero."""
+    return isinstance(value, (int, float)) and value > 0
+
+
+def _is_log_level(value: Any) -> bool:
+    """Check that a setting names a standard logging level."""
+    return isinstance(value, str) and value.upper() in _VALID_LOG_LEVELS
+
+
+# (key, predicate) pairs checked by Config.validate, stopping at the first failure
+_VALIDATION_RULES = (
+    ("max_file_size_mb", _is_positive_number),
+    ("conversation_threshold_hours", _is_positive_number),
+    ("logging_level", _is_log_level),
+)
+
+
 class Config:
     """Configuration manager for WhatsApp Chat Analyzer."""
     
@@ -59,19 +100,11 @@ class Config:
             value = os.getenv(env_var)
             if value is not None:
                 # Convert string values to appropriate types
-                if config_key == "debug_mode":
-                    self._config[config_key] = value.lower() in ("true", "1", "yes", "on")
-                elif config_key == "anonymize_default":
-                    self._config[config_key] = value.lower() in ("true", "1", "yes", "on")
-                elif config_key == "include_media_default":
-                    self._config[config_key] = value.lower() in ("true", "1", "yes", "on")
-                elif config_key in ["max_file_size_mb", "conversation_threshold_hours", "max_messages_preview"]:
-                    try:
-                        self._config[config_key] = int(value)
-                    except ValueError:
-                        pass  # Keep default if conversion fails
-                else:
-                    self._config[config_key] = value
+                converter = _CONVERTERS.get(config_key, str)
+                try:
+                    self._config[config_key] = converter(value)
+                except ValueError:
+                    pass  # Keep default if conversion fails
     
     def _load_config_file(self, config_file: str):
         """Load configuration from file (future enhancement)."""
@@ -122,20 +155,8 @@ class Config:
         Returns:
             True if configuration is valid
         """
-        # Validate file size limit
-        if self.get("max_file_size_mb", 0) <= 0:
-            return False
-        
-        # Validate conversation threshold
-        if self.get("conversation_threshold_hours", 0) <= 0:
-            return False
-        
-        # Validate logging level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.get("logging_level", "").upper() not in valid_log_levels:
-            return False
-        
-        return True
+        config = self._config
+        return all(is_valid(config.get(key)) for key, is_valid in _VALIDATION_RULES)
 
 
 # Global configuration instance
@@ -6,17 +6,148 @@ analyses on a parsed chat DataFrame, from basic stats to complex
 engagement and temporal pattern detection.
 """
 
+import functools
 import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import IO, Dict, Any, List, Optional, Callable, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 from collections import Counter
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from .parser import DAYS_OF_WEEK
+
 logger = logging.getLogger(__name__)
 
+# Longest message prefix passed to VADER; keeps sticker/emoji floods and
+# pasted walls of text from stalling the analysis
+SENTIMENT_MAX_CHARS = 500
+
+# Distinct messages needed before VADER scoring is spread over worker
+# processes; below this, pool start-up costs more than it saves
+SENTIMENT_PARALLEL_MIN_MESSAGES = 10_000
+
+# Chunks per worker process, so a few very long messages do not leave
+# one worker running after the others have finished
+SENTIMENT_CHUNKS_PER_WORKER = 4
+
+# Word tokens for frequency analysis
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Common words excluded from word frequency analysis
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'in', 'is', 'it', 'to', 'for', 'of', 'on', 'and', 'i', 'you',
+    'that', 'be', 'with', 'was', 'are', 'this', 'have', 'but', 'not', 'at', 'my', 'me'
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sentiment_analyzer() -> SentimentIntensityAnalyzer:
+    """Load the VADER lexicon once and share the analyzer across instances."""
+    return SentimentIntensityAnalyzer()
+
+
+def _score_messages(messages: List[str]) -> List[float]:
+    """
+    Compute VADER compound scores; also the unit of work for worker processes.
+    
+    VADER is quadratic in the token count (emoji expand to several tokens
+    each), so only the head of very long messages is scored.
+    """
+    polarity_scores = _get_sentiment_analyzer().polarity_scores
+    return [polarity_scores(msg[:SENTIMENT_MAX_CHARS])['compound'] for msg in messages]
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on, honouring affinity masks."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is Linux-only
+        return os.cpu_count() or 1
+
+
+def _score_messages_parallel(messages: List[str], n_jobs: int = 1) -> List[float]:
+    """
+    Score messages across worker processes, falling back to a serial pass.
+    
+    Workers are spawned rather than forked, since forking a process that
+    already runs other threads (e.g. a Streamlit server) can deadlock.
+    Small inputs are scored in-process, as is any environment where a
+    process pool cannot be started.
+    
+    Args:
+        messages: Message texts to score
+        n_jobs: Worker processes to use; 1 scores serially, -1 uses every
+            CPU available to this process
+        
+    Returns:
+        Compound scores in the same order as messages
+    """
+    workers = _available_cpus() if n_jobs < 0 else n_jobs
+    if workers < 2 or len(messages) < SENTIMENT_PARALLEL_MIN_MESSAGES:
+        return _score_messages(messages)
+    
+    size = -(-len(messages) // (workers * SENTIMENT_CHUNKS_PER_WORKER))
+    chunks = [messages[start:start + size] for start in range(0, len(messages), size)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            return list(chain.from_iterable(pool.map(_score_messages, chunks)))
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"Parallel sentiment scoring unavailable, scoring serially: {e}")
+        return _score_messages(messages)
+
+
+def _memoize(method: Callable) -> Callable:
+    """
+    Cache a ChatAnalyzer method's result per argument signature.
+    
+    Results live in the instance's ``_cache`` dict, which is cleared whenever
+    ``chat_data`` is reassigned. Callers that mutate ``chat_data`` in place
+    must call ``clear_cache()`` themselves. Cached results, charts included,
+    are shared between callers and must not be modified.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+            return result
+    return wrapper
+
+
+def _append_frame(worksheet, df: pd.DataFrame, index: bool = False):
+    """
+    Stream a DataFrame into a write-only openpyxl worksheet one row at a time.
+    
+    Missing values become empty cells, as with DataFrame.to_excel.
+    
+    Args:
+        worksheet: Worksheet from a ``Workbook(write_only=True)``
+        df: DataFrame to write, header row first
+        index: Whether to write the index as the first column
+    """
+    columns = [df[name] for name in df.columns]
+    header = list(df.columns)
+    if index:
+        columns.insert(0, df.index.to_series())
+        header.insert(0, df.index.name)
+    worksheet.append(header)
+    values = [column.astype(object).where(column.notna(), None).tolist() for column in columns]
+    for row in zip(*values):
+        worksheet.append(row)
+
 
 class ChatAnalyzer:
     """
@@ -26,43 +157,63 @@ class ChatAnalyzer:
         chat_data (pd.DataFrame): The input DataFrame of parsed chat messages.
     """
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, n_jobs: int = 1):
         """
         Initialize the analyzer with a chat DataFrame.
         
         Args:
             df: A DataFrame containing parsed WhatsApp chat data.
+            n_jobs: Worker processes for sentiment scoring; 1 (the default)
+                scores serially, -1 uses every available CPU.
         """
         if not isinstance(df, pd.DataFrame) or df.empty:
             raise ValueError("A non-empty pandas DataFrame is required.")
         
+        self._cache: Dict[Any, Any] = {}
         # --- FIX: Sort by timestamp to ensure correct chronological order ---
         # This is crucial for accurate time difference calculations (e.g., response times).
-        df = df.sort_values(by="ts").reset_index(drop=True)
-        
-        self.chat_data = df.copy()
-        self._analyze_sentiment()
+        # The sort already returns a new frame, so the caller's df is never modified;
+        # a stable sort keeps messages sent within the same minute in export order.
+        self.chat_data = df.sort_values(by="ts", kind="mergesort").reset_index(drop=True)
+        self._analyze_sentiment(n_jobs)
+
+    @property
+    def chat_data(self) -> pd.DataFrame:
+        """The parsed chat messages being analyzed."""
+        return self._chat_data
+
+    @chat_data.setter
+    def chat_data(self, df: pd.DataFrame):
+        self._chat_data = df
+        self.clear_cache()
 
-    def _analyze_sentiment(self):
+    def clear_cache(self):
+        """Drop memoized analysis results, e.g. after mutating chat_data in place."""
+        self._cache.clear()
+
+    def _analyze_sentiment(self, n_jobs: int = 1):
         """
         Calculate sentiment scores for each message using VADER.
         
         This method adds 'sentiment_score' and 'sentiment_label' columns
         to the chat_data DataFrame.
+        
+        Args:
+            n_jobs: Worker processes for scoring, as in __init__
         """
-        analyzer = SentimentIntensityAnalyzer()
-        messages = self.chat_data['Message'].astype(str)
-        sentiment_scores = messages.apply(
-            lambda msg: analyzer.polarity_scores(msg)['compound']
-        )
-        self.chat_data['sentiment_score'] = sentiment_scores
+        # Chats repeat short messages ("ok", "lol", stickers) constantly, so
+        # each distinct text is scored once and broadcast back
+        codes, unique_messages = pd.factorize(self.chat_data['Message'].astype(str))
         
-        def to_label(score):
-            if score > 0.05: return "Positive"
-            elif score < -0.05: return "Negative"
-            else: return "Neutral"
+        unique_scores = np.asarray(
+            _score_messages_parallel(unique_messages.tolist(), n_jobs), dtype=np.float64
+        )
+        scores = unique_scores[codes]
+        self.chat_data['sentiment_score'] = scores
         
-        self.chat_data['sentiment_label'] = sentiment_scores.apply(to_label)
+        self.chat_data['sentiment_label'] = np.select(
+            [scores > 0.05, scores < -0.05], ["Positive", "Negative"], default="Neutral"
+        )
         logger.info("Completed sentiment analysis on chat data.")
 
     # --- NEW: Function to get random samples for sentiment debugging ---
@@ -77,24 +228,33 @@ class ChatAnalyzer:
             A DataFrame with sample messages and their sentiment scores.
         """
         # Exclude media messages as they have no sentiment
-        text_messages = self.chat_data[~self.chat_data["is_media"]]
-        if text_messages.empty:
+        text_positions = np.flatnonzero(~self.chat_data["is_media"].to_numpy())
+        if text_positions.size == 0:
             return pd.DataFrame()
         
         # Ensure we don't request more samples than available messages
-        num_samples = min(n, len(text_messages))
+        num_samples = min(n, text_positions.size)
         
-        return text_messages.sample(n=num_samples)[
+        # Draw positions rather than filtering and shuffling the whole frame;
+        # only the sampled rows are ever copied
+        sampled = np.random.default_rng().choice(text_positions, size=num_samples, replace=False)
+        return self.chat_data.iloc[sampled][
             ["Author", "Message", "sentiment_score", "sentiment_label"]
         ]
 
+    @_memoize
+    def _get_word_counts(self) -> pd.Series:
+        """Count whitespace-separated words per message, shared by the stats methods."""
+        return self.chat_data["Message"].str.count(r"\S+")
+
+    @_memoize
     def get_basic_stats(self) -> Dict[str, Any]:
         """Get basic statistics from the chat data."""
         total_messages = len(self.chat_data)
         total_participants = self.chat_data["Author"].nunique()
         days_active = self.chat_data["date"].nunique()
-        text_messages = self.chat_data[~self.chat_data["is_media"]]
-        avg_words = round(text_messages["Message"].str.split().str.len().mean(), 2)
+        word_counts = self._get_word_counts()
+        avg_words = round(word_counts[~self.chat_data["is_media"]].mean(), 2)
         
         return {
             "total_messages": total_messages,
@@ -107,13 +267,28 @@ class ChatAnalyzer:
             },
         }
 
+    @_memoize
     def get_date_activity(self) -> pd.Series:
         """Get message count per date."""
         return self.chat_data.groupby("date")["Message"].count()
 
+    @_memoize
+    def get_hourly_activity(self) -> pd.Series:
+        """Get message count per hour of the day."""
+        return self.chat_data.groupby("hour")["Message"].count()
+
+    @_memoize
+    def get_daily_activity(self) -> pd.Series:
+        """Get message count per day of the week, Monday first."""
+        # Reindex rather than rely on the parser's ordered categorical, so
+        # frames built elsewhere (plain string "dow") get the same layout
+        daily_activity = self.chat_data.groupby("dow", observed=True)["Message"].count()
+        return daily_activity.reindex(DAYS_OF_WEEK, fill_value=0)
+
+    @_memoize
     def create_hourly_activity_chart(self) -> px.bar:
         """Create a bar chart of messages per hour."""
-        hourly_activity = self.chat_data.groupby("hour")["Message"].count()
+        hourly_activity = self.get_hourly_activity()
         chart = px.bar(
             hourly_activity, x=hourly_activity.index, y=hourly_activity.values,
             labels={"x": "Hour of Day", "y": "Number of Messages"}, template="plotly_white"
@@ -121,11 +296,10 @@ class ChatAnalyzer:
         chart.update_layout(showlegend=False)
         return chart
 
+    @_memoize
     def create_daily_activity_chart(self) -> px.bar:
         """Create a bar chart of messages per day of the week."""
-        daily_activity = self.chat_data.groupby("dow")["Message"].count()
-        days_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        daily_activity = daily_activity.reindex(days_order)
+        daily_activity = self.get_daily_activity()
         chart = px.bar(
             daily_activity, x=daily_activity.index, y=daily_activity.values,
             labels={"x": "Day of Week", "y": "Number of Messages"}, template="plotly_white"
@@ -133,21 +307,25 @@ class ChatAnalyzer:
         chart.update_layout(showlegend=False)
         return chart
     
+    @_memoize
     def get_participant_stats(self) -> pd.DataFrame:
         """Get detailed statistics for each participant."""
         stats = (
-            self.chat_data.groupby("Author").agg(
+            self.chat_data.assign(word_count=self._get_word_counts()).groupby("Author", observed=True).agg(
                 messages=("Message", "count"),
-                words=("Message", lambda s: s.str.split().str.len().sum()),
+                words=("word_count", "sum"),
                 media_sent=("is_media", "sum"),
             ).sort_values(by="messages", ascending=False)
         )
         stats["avg_words"] = (stats["words"] / (stats["messages"] - stats["media_sent"])).round(2)
         return stats
 
+    @_memoize
     def create_participant_activity_chart(self, top_n: int = 10) -> px.bar:
         """Create a bar chart of top N participants by message count."""
-        participant_activity = self.chat_data["Author"].value_counts().nlargest(top_n)
+        participant_activity = self.chat_data["Author"].value_counts()
+        # Categorical value_counts also lists authors with no messages left
+        participant_activity = participant_activity[participant_activity > 0].nlargest(top_n)
         chart = px.bar(
             participant_activity, x=participant_activity.index, y=participant_activity.values,
             labels={"x": "Participant", "y": "Number of Messages"}, template="plotly_white"
@@ -155,22 +333,50 @@ class ChatAnalyzer:
         chart.update_layout(showlegend=False)
         return chart
 
+    @_memoize
+    def _get_message_gaps(self) -> Tuple[pd.Series, pd.Series]:
+        """
+        Compute the gap before each message and whether its author changed.
+        
+        Shared by the response-time and conversation-starter analyses for
+        every threshold. Kept off chat_data so concurrent readers never see
+        the frame change shape.
+        
+        Returns:
+            Tuple of (seconds since the previous message, author-change mask)
+        """
+        time_diff = self.chat_data["ts"].diff().dt.total_seconds().rename("time_diff")
+        # Compare integer author codes with their predecessor instead of
+        # shifting the column and comparing strings
+        author = self.chat_data["Author"]
+        if isinstance(author.dtype, pd.CategoricalDtype):
+            codes = author.cat.codes.to_numpy()
+        else:
+            codes = pd.factorize(author)[0]
+        changed = np.empty(len(codes), dtype=bool)
+        changed[:1] = True
+        np.not_equal(codes[1:], codes[:-1], out=changed[1:])
+        return time_diff, pd.Series(changed, index=author.index)
+
+    @_memoize
     def get_response_times(self, threshold_hours: int) -> pd.Series:
         """Calculate average response time for each participant."""
-        self.chat_data["time_diff"] = self.chat_data["ts"].diff().dt.total_seconds()
-        response_df = self.chat_data[
-            (self.chat_data["Author"] != self.chat_data["Author"].shift(1)) &
-            (self.chat_data["time_diff"] < threshold_hours * 3600)
-        ]
-        avg_response_times = response_df.groupby("Author")["time_diff"].mean().sort_values()
+        time_diff, author_changed = self._get_message_gaps()
+        is_response = author_changed & (time_diff < threshold_hours * 3600)
+        avg_response_times = (
+            time_diff[is_response].groupby(self.chat_data["Author"][is_response], observed=True).mean().sort_values()
+        )
         return avg_response_times.round(2)
 
+    @_memoize
     def get_conversation_starters(self, threshold_hours: int) -> pd.Series:
         """Identify who starts conversations most often."""
-        time_diff = self.chat_data["ts"].diff().dt.total_seconds()
+        time_diff, _ = self._get_message_gaps()
         starters = self.chat_data[time_diff > threshold_hours * 3600]["Author"].value_counts()
-        return starters
+        # Categorical value_counts also lists authors who never started one
+        return starters[starters > 0]
 
+    @_memoize
     def create_conversation_starters_chart(self, threshold_hours: int) -> px.pie:
         """Create a pie chart of conversation starters."""
         starters = self.get_conversation_starters(threshold_hours)
@@ -180,6 +386,7 @@ class ChatAnalyzer:
         chart.update_traces(textposition='inside', textinfo='percent+label')
         return chart
 
+    @_memoize
     def create_sentiment_over_time_chart(self, rolling_window: int = 7) -> px.line:
         """Create a line chart showing the trend of sentiment over time."""
         daily_sentiment = self.chat_data.groupby('date')['sentiment_score'].mean().reset_index()
@@ -195,36 +402,42 @@ class ChatAnalyzer:
         chart.update_layout(yaxis_title="Sentiment (Negative to Positive)", showlegend=False)
         return chart
 
+    @_memoize
     def get_emoji_analysis(self, emoji_extractor_func: Callable) -> Dict[str, Any]:
         """Analyze emoji usage in the chat."""
-        all_emojis = [
-            emoji for msg in self.chat_data["Message"] for emoji in emoji_extractor_func(msg)
-        ]
-        if not all_emojis:
+        # Extract from each distinct message once and weight by its count;
+        # value_counts(sort=False) keeps first-appearance order, so ties in
+        # most_common rank exactly as a per-message scan would
+        message_counts = self.chat_data["Message"].value_counts(sort=False)
+        emoji_counts = Counter()
+        for msg, count in zip(message_counts.index, message_counts.tolist()):
+            for emoji in emoji_extractor_func(msg):
+                emoji_counts[emoji] += count
+        if not emoji_counts:
             return {"total_emojis": 0, "unique_emojis": 0, "top_emojis": []}
-        emoji_counts = Counter(all_emojis)
         return {
-            "total_emojis": len(all_emojis), "unique_emojis": len(emoji_counts),
+            "total_emojis": sum(emoji_counts.values()), "unique_emojis": len(emoji_counts),
             "top_emojis": emoji_counts.most_common(10),
         }
 
+    @_memoize
     def get_word_analysis(self, top_n: int = 20) -> Dict[str, Any]:
         """Analyze word frequency, excluding common stop words."""
-        stop_words = set([
-            'the', 'a', 'an', 'in', 'is', 'it', 'to', 'for', 'of', 'on', 'and', 'i', 'you',
-            'that', 'be', 'with', 'was', 'are', 'this', 'have', 'but', 'not', 'at', 'my', 'me'
-        ])
         text_messages = self.chat_data[~self.chat_data["is_media"]]["Message"].astype(str)
-        words = text_messages.str.lower().str.findall(r'\b\w+\b').explode()
-        filtered_words = words[~words.isin(stop_words) & words.notna()]
-        if filtered_words.empty:
+        # One regex pass over the joined corpus; stop words are dropped as
+        # tokens stream into the Counter, so no per-token Series is built
+        text = "\n".join(text_messages.tolist()).lower()
+        word_counts = Counter(
+            word for word in _WORD_PATTERN.findall(text) if word not in STOP_WORDS
+        )
+        if not word_counts:
             return {"total_words": 0, "unique_words": 0, "top_words": []}
-        word_counts = Counter(filtered_words)
         return {
-            "total_words": len(filtered_words), "unique_words": len(word_counts),
+            "total_words": sum(word_counts.values()), "unique_words": len(word_counts),
             "top_words": word_counts.most_common(top_n),
         }
 
+    @_memoize
     def get_all_insights(self) -> Dict[str, Any]:
         """Get all analysis insights as a single dictionary."""
         return {
@@ -233,12 +446,31 @@ class ChatAnalyzer:
             "word_analysis": self.get_word_analysis(),
         }
 
-    def export_analysis_report(self, file_path: str):
-        """Export analysis to an Excel file with multiple sheets."""
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            self.chat_data.to_excel(writer, sheet_name='Raw Data', index=False)
-            self.get_participant_stats().to_excel(writer, sheet_name='Participant Stats')
-            basic_stats_df = pd.DataFrame.from_dict(
-                self.get_basic_stats(), orient='index', columns=['Value']
-            )
-            basic_stats_df.to_excel(writer, sheet_name='Summary')
\ No newline at end of file
+    def export_analysis_report(self, file_path: Union[str, IO[bytes]]):
+        """
+        Export analysis to an Excel file with multiple sheets.
+        
+        Uses a write-only openpyxl workbook so rows are streamed out
+        instead of building a cell object for every value of the raw data.
+        
+        Args:
+            file_path: Destination .xlsx path, or a binary file object such
+                as io.BytesIO
+        """
+        from openpyxl import Workbook
+        
+        basic_stats = {
+            key: str(value) if isinstance(value, dict) else value
+            for key, value in self.get_basic_stats().items()
+        }
+        workbook = Workbook(write_only=True)
+        _append_frame(workbook.create_sheet('Raw Data'), self.chat_data)
+        _append_frame(
+            workbook.create_sheet('Participant Stats'), self.get_participant_stats(), index=True
+        )
+        _append_frame(
+            workbook.create_sheet('Summary'),
+            pd.DataFrame.from_dict(basic_stats, orient='index', columns=['Value']),
+            index=True,
+        )
+        workbook.save(file_path)
\ No newline at end of file
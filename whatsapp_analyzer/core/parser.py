@@ -5,10 +5,13 @@ This module handles the parsing of WhatsApp chat exports from both Android and i
 with automatic platform detection and robust error handling.
 """
 
+import codecs
+import io
 import re
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional, Union
+from itertools import chain, islice
+from typing import Iterable, List, Dict, Any, Tuple, Optional, Union
 from pathlib import Path
 
 import pandas as pd
@@ -31,6 +34,90 @@ IOS_PATTERN = re.compile(
     "\\]"                                      # closing bracket
 )
 
+# Placeholders WhatsApp writes in place of media attachments
+MEDIA_PLACEHOLDERS = frozenset({
+    "<Media omitted>",      # Android
+    "image omitted",        # iOS
+    "video omitted",
+    "audio omitted",
+    "GIF omitted",
+    "sticker omitted",
+    "document omitted",
+    "Contact card omitted",
+})
+
+# Weekday names in calendar order, used as the ordered categories of "dow"
+DAYS_OF_WEEK = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Read buffer size used when streaming exports from files or chunk iterators
+STREAM_BUFFER_SIZE = 1 << 20
+
+# Byte order marks and the codec that consumes them. UTF-32 must precede
+# UTF-16 since the UTF-32-LE BOM starts with the UTF-16-LE one.
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Platform detection only samples the head of the export, so an auto-detect
+# costs at most this many extra header matches on top of the parse itself
+DETECTION_SAMPLE_LINES = 100
+
+# Lead in matching lines at which detection stops scanning the sample
+DETECTION_CONFIDENCE = 20
+
+# Full-line variants of the header patterns. One match yields the date, time
+# and the rest of the line, so parsing needs no further slicing or re-matching.
+_ANDROID_LINE_PATTERN = re.compile(
+    r"^([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4}), ([0-9]{1,2}:[0-9]{2}\s*(?:[AP]M|am|pm)?) - ?(.*)",
+    re.DOTALL,
+)
+_IOS_LINE_PATTERN = re.compile(IOS_PATTERN.pattern + "(.*)", re.DOTALL)
+
+# Both header patterns as one anchored alternation; the named group that
+# matched (Match.lastgroup) tells detection which platform a line belongs to
+_HEADER_PATTERN = re.compile(
+    "(?P<android>" + _ANDROID_LINE_PATTERN.pattern + ")|(?P<ios>" + _IOS_LINE_PATTERN.pattern + ")",
+    re.DOTALL,
+)
+
+# Candidate timestamp formats per platform, tried in order
+ANDROID_TIMESTAMP_FORMATS = [
+    # Month-first formats (US style)
+    "%m/%d/%Y %I:%M %p", "%m/%d/%y %I:%M %p",
+    "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M",
+    # Day-first formats (European/Indian style)
+    "%d/%m/%Y %I:%M %p", "%d/%m/%y %I:%M %p",
+    "%d/%m/%Y %H:%M", "%d/%m/%y %H:%M"
+]
+
+IOS_TIMESTAMP_FORMATS = [
+    # Day-first formats
+    "%d-%m-%Y %H:%M:%S", "%d-%m-%y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S", "%d/%m/%y %H:%M:%S",
+    "%d-%m-%Y %H:%M", "%d-%m-%y %H:%M",
+    "%d/%m/%Y %H:%M", "%d/%m/%y %H:%M",
+    "%d-%m-%Y %I:%M:%S %p", "%d-%m-%y %I:%M:%S %p",
+    "%d/%m/%Y %I:%M:%S %p", "%d/%m/%y %I:%M:%S %p",
+    "%d-%m-%Y %I:%M %p", "%d-%m-%y %I:%M %p",
+    "%d/%m/%Y %I:%M %p", "%d/%m/%y %I:%M %p",
+    # Month-first formats (US style iOS exports)
+    "%m-%d-%Y %H:%M:%S", "%m-%d-%y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S", "%m/%d/%y %H:%M:%S",
+    "%m-%d-%Y %H:%M", "%m-%d-%y %H:%M",
+    "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M",
+    "%m-%d-%Y %I:%M:%S %p", "%m-%d-%y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M:%S %p", "%m/%d/%y %I:%M:%S %p",
+    "%m-%d-%Y %I:%M %p", "%m-%d-%y %I:%M %p",
+    "%m/%d/%Y %I:%M %p", "%m/%d/%y %I:%M %p",
+]
+
+# Timestamps probed per candidate format when ranking them for an export
+TIMESTAMP_SAMPLE_SIZE = 100
+
 
 class ChatParseError(Exception):
     """Raised when chat parsing fails."""
@@ -44,7 +131,10 @@ class PlatformDetectionError(Exception):
 
 def _decode_file_content(file_content: Union[bytes, str]) -> List[str]:
     """
-    Decode file content trying common encodings for WhatsApp exports.
+    Decode file content in a single pass using a BOM-sniffed encoding.
+    
+    Undecodable bytes are replaced rather than triggering a retry with
+    another codec.
     
     Args:
         file_content: Raw file content as bytes or string
@@ -53,31 +143,52 @@ def _decode_file_content(file_content: Union[bytes, str]) -> List[str]:
         List of decoded lines
         
     Raises:
-        ChatParseError: If decoding fails with all attempted encodings
+        ChatParseError: If decoding fails
     """
     if isinstance(file_content, str):
         return file_content.splitlines()
     
-    encodings = ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be"]
+    encoding = _sniff_encoding(file_content)
+    logger.debug(f"Decoding chat export as {encoding}")
     
-    for encoding in encodings:
-        try:
-            decoded = file_content.decode(encoding)
-            logger.debug(f"Successfully decoded with {encoding}")
-            return decoded.splitlines()
-        except UnicodeDecodeError as e:
-            logger.debug(f"Failed to decode with {encoding}: {e}")
-            continue
-    
-    # Fallback to utf-8 with error handling
     try:
-        decoded = file_content.decode("utf-8", errors="ignore")
-        logger.warning("Using utf-8 with error handling as fallback")
-        return decoded.splitlines()
+        return _read_lines(file_content, encoding, errors="replace")
     except Exception as e:
         raise ChatParseError(f"Failed to decode file content: {e}")
 
 
+def _sniff_encoding(file_content: bytes) -> str:
+    """
+    Pick the codec for a chat export from its byte order mark.
+    
+    Args:
+        file_content: Raw file content
+        
+    Returns:
+        Codec name; UTF-8 when no BOM is present
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if file_content.startswith(bom):
+            return encoding
+    return "utf-8"
+
+
+def _read_lines(file_content: bytes, encoding: str, errors: str = "strict") -> List[str]:
+    """
+    Decode bytes line by line without materializing the whole decoded text.
+    
+    Args:
+        file_content: Raw file content
+        encoding: Codec to decode with
+        errors: Codec error handling policy
+        
+    Returns:
+        List of decoded lines without line terminators
+    """
+    with io.TextIOWrapper(io.BytesIO(file_content), encoding=encoding, errors=errors) as reader:
+        return [line.rstrip("\n") for line in reader]
+
+
 def _clean_line(line: str) -> str:
     """
     Clean line by removing directionality marks and normalizing spaces.
@@ -88,6 +199,10 @@ def _clean_line(line: str) -> str:
     Returns:
         Cleaned line
     """
+    # Pure-ASCII lines cannot contain directionality marks or a BOM
+    # (str.isascii() is O(1) in CPython), so skip the replace scans
+    if line.isascii():
+        return line.strip("\n\r")
     # Remove directionality marks common in iOS exports
     cleaned = line.replace("\u200e", "").replace("\u200f", "")
     # Remove BOM and normalize whitespace
@@ -95,22 +210,39 @@ def _clean_line(line: str) -> str:
     return cleaned
 
 
+def _match_android_header(line: str) -> Optional[re.Match]:
+    """Match an Android message header, rejecting non-digit lines before the regex."""
+    if not line[:1].isdigit():
+        return None
+    return _ANDROID_LINE_PATTERN.match(line)
+
+
+def _match_ios_header(line: str) -> Optional[re.Match]:
+    """Match an iOS message header, rejecting lines without '[' before the regex."""
+    if not line.startswith("["):
+        return None
+    return _IOS_LINE_PATTERN.match(line)
+
+
 def _is_android_format(line: str) -> bool:
     """Check if line matches Android format."""
-    return ANDROID_PATTERN.match(line) is not None
+    return _match_android_header(line) is not None
 
 
 def _is_ios_format(line: str) -> bool:
     """Check if line matches iOS format."""
-    return IOS_PATTERN.match(line) is not None
+    return _match_ios_header(line) is not None
 
 
-def _parse_android_line(line: str) -> Tuple[str, str, Optional[str], str]:
+def _parse_android_line(
+    line: str, match: Optional[re.Match] = None
+) -> Tuple[str, str, Optional[str], str]:
     """
     Parse Android format line: "DATE, TIME - AUTHOR: MESSAGE"
     
     Args:
         line: Line in Android format
+        match: Pre-computed header match for the line, if available
         
     Returns:
         Tuple of (date, time, author, message)
@@ -119,12 +251,12 @@ def _parse_android_line(line: str) -> Tuple[str, str, Optional[str], str]:
         ChatParseError: If line format is invalid
     """
     try:
-        parts = line.split(" - ", 1)
-        if len(parts) != 2:
+        if match is None:
+            match = _match_android_header(line)
+        if not match:
             raise ChatParseError(f"Invalid Android format: {line}")
         
-        date_time, message_part = parts
-        date, time = date_time.split(", ", 1)
+        date, time, message_part = match.groups()
         
         if ":" in message_part:
             author, message = message_part.split(": ", 1)
@@ -136,12 +268,15 @@ def _parse_android_line(line: str) -> Tuple[str, str, Optional[str], str]:
         raise ChatParseError(f"Failed to parse Android line '{line}': {e}")
 
 
-def _parse_ios_line(line: str) -> Tuple[str, str, Optional[str], str]:
+def _parse_ios_line(
+    line: str, match: Optional[re.Match] = None
+) -> Tuple[str, str, Optional[str], str]:
     """
     Parse iOS format line: "[DATE, TIME] AUTHOR: MESSAGE"
     
     Args:
         line: Line in iOS format
+        match: Pre-computed header match for the line, if available
         
     Returns:
         Tuple of (date, time, author, message)
@@ -150,18 +285,19 @@ def _parse_ios_line(line: str) -> Tuple[str, str, Optional[str], str]:
         ChatParseError: If line format is invalid
     """
     try:
-        match = IOS_PATTERN.match(line)
+        if match is None:
+            match = _match_ios_header(line)
         if not match:
             raise ChatParseError(f"Invalid iOS format: {line}")
         
-        date, time, ampm = match.groups()
+        date, time, ampm, message_part = match.groups()
         
         # Normalize AM/PM
         if ampm:
             time = f"{time} {ampm.upper()}"
         
-        # Extract message part after the timestamp
-        message_part = line[match.end():].lstrip()
+        # Message part after the timestamp
+        message_part = message_part.lstrip()
         
         # --- FIX STARTS HERE ---
         # Robustly split author and message. This now handles system messages
@@ -186,6 +322,11 @@ def _parse_ios_line(line: str) -> Tuple[str, str, Optional[str], str]:
         raise ChatParseError(f"Failed to parse iOS line '{line}': {e}")
 
 
+def _timestamp_formats(platform: str) -> List[str]:
+    """Return the candidate timestamp formats for a platform, in priority order."""
+    return ANDROID_TIMESTAMP_FORMATS if platform == "android" else IOS_TIMESTAMP_FORMATS
+
+
 def _parse_timestamp(date: str, time: str, platform: str) -> Optional[datetime]:
     """
     Parse date and time strings into datetime object.
@@ -198,55 +339,90 @@ def _parse_timestamp(date: str, time: str, platform: str) -> Optional[datetime]:
     Returns:
         Parsed datetime or None if parsing fails
     """
+    # Same format list as _parse_timestamps, tried directly: ranking a
+    # sample and the column-wise cascade only pay off for a whole export
     date_time_str = f"{date} {time}"
     
-    if platform == "android":
-        formats = [
-            # Month-first formats (US style)
-            "%m/%d/%Y %I:%M %p", "%m/%d/%y %I:%M %p",
-            "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M",
-            # Day-first formats (European/Indian style)
-            "%d/%m/%Y %I:%M %p", "%d/%m/%y %I:%M %p",
-            "%d/%m/%Y %H:%M", "%d/%m/%y %H:%M"
-        ]
-    else:  # iOS
-        formats = [
-            # Day-first formats
-            "%d-%m-%Y %H:%M:%S", "%d-%m-%y %H:%M:%S",
-            "%d/%m/%Y %H:%M:%S", "%d/%m/%y %H:%M:%S",
-            "%d-%m-%Y %H:%M", "%d-%m-%y %H:%M",
-            "%d/%m/%Y %H:%M", "%d/%m/%y %H:%M",
-            "%d-%m-%Y %I:%M:%S %p", "%d-%m-%y %I:%M:%S %p",
-            "%d/%m/%Y %I:%M:%S %p", "%d/%m/%y %I:%M:%S %p",
-            "%d-%m-%Y %I:%M %p", "%d-%m-%y %I:%M %p",
-            "%d/%m/%Y %I:%M %p", "%d/%m/%y %I:%M %p",
-            # Month-first formats (US style iOS exports)
-            "%m-%d-%Y %H:%M:%S", "%m-%d-%y %H:%M:%S",
-            "%m/%d/%Y %H:%M:%S", "%m/%d/%y %H:%M:%S",
-            "%m-%d-%Y %H:%M", "%m-%d-%y %H:%M",
-            "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M",
-            "%m-%d-%Y %I:%M:%S %p", "%m-%d-%y %I:%M:%S %p",
-            "%m/%d/%Y %I:%M:%S %p", "%m/%d/%y %I:%M:%S %p",
-            "%m-%d-%Y %I:%M %p", "%m-%d-%y %I:%M %p",
-            "%m/%d/%Y %I:%M %p", "%m/%d/%y %I:%M %p",
-        ]
-    
-    for fmt in formats:
+    for fmt in _timestamp_formats(platform):
         try:
             return datetime.strptime(date_time_str, fmt)
         except ValueError:
             continue
     
-    logger.warning(f"Failed to parse timestamp: {date_time_str}")
     return None
 
 
-def detect_platform(lines: List[str]) -> str:
+def _rank_timestamp_formats(date_time: pd.Series, formats: List[str]) -> List[str]:
+    """
+    Order candidate formats by how well they fit an export's timestamps.
+    
+    An export almost always uses a single format throughout, so probing a
+    sample spread over the column lets the full cascade parse nearly every
+    row in its first pass. Ranking every format (not just the winner) also
+    keeps ambiguous dates such as 1/2/23 on the order that the rest of the
+    export uses. Ties keep the original priority order.
+    
+    Args:
+        date_time: Series of "DATE TIME" strings without missing values
+        formats: Candidate formats in priority order
+        
+    Returns:
+        The same formats, most sample matches first
+    """
+    step = max(1, len(date_time) // TIMESTAMP_SAMPLE_SIZE)
+    sample = date_time.iloc[::step].iloc[:TIMESTAMP_SAMPLE_SIZE]
+    hits = {
+        fmt: int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+        for fmt in formats
+    }
+    # sorted() is stable, so equally good formats keep their priority
+    return sorted(formats, key=hits.__getitem__, reverse=True)
+
+
+def _parse_timestamps(date_time: pd.Series, platform: str) -> pd.Series:
+    """
+    Vectorized counterpart of _parse_timestamp for a whole column.
+    
+    Each candidate format is applied with pd.to_datetime to the rows that are
+    still unparsed, so every row gets the first format that matches it. The
+    format that fits a sample of the export best is tried first.
+    
+    Args:
+        date_time: Series of "DATE TIME" strings (NaN for missing values)
+        platform: Platform identifier ('android' or 'ios')
+        
+    Returns:
+        Series of timestamps, NaT where no format matched
+    """
+    result = pd.Series(pd.NaT, index=date_time.index, dtype="datetime64[ns]")
+    remaining = date_time.notna()
+    
+    formats = _rank_timestamp_formats(date_time[remaining], _timestamp_formats(platform))
+    for fmt in formats:
+        if not remaining.any():
+            break
+        parsed = pd.to_datetime(date_time[remaining], format=fmt, errors="coerce")
+        result[remaining] = parsed
+        remaining &= result.isna()
+    
+    if remaining.any():
+        logger.warning(
+            f"Failed to parse {int(remaining.sum())} timestamps "
+            f"(e.g. {date_time[remaining].iloc[0]!r})"
+        )
+    return result
+
+
+def detect_platform(lines: List[str], confidence: int = DETECTION_CONFIDENCE) -> str:
     """
     Detect platform from chat export lines.
     
+    Scanning stops early once one platform leads the other by `confidence`
+    matching lines.
+    
     Args:
         lines: List of lines from chat export
+        confidence: Match lead at which the scan short-circuits
         
     Returns:
         Platform identifier ('android' or 'ios')
@@ -256,16 +432,24 @@ def detect_platform(lines: List[str]) -> str:
     """
     android_count = 0
     ios_count = 0
+    match_header = _HEADER_PATTERN.match
     
-    for line in lines[:100]:  # Check first 100 lines
+    for line in islice(lines, DETECTION_SAMPLE_LINES):
         cleaned = _clean_line(line.strip())
         if not cleaned:
             continue
-            
-        if _is_android_format(cleaned):
+        
+        # One match attempt classifies the line as Android, iOS, or neither
+        header_match = match_header(cleaned)
+        if header_match is None:
+            continue
+        if header_match.lastgroup == "android":
             android_count += 1
-        elif _is_ios_format(cleaned):
+        else:
             ios_count += 1
+        
+        if abs(android_count - ios_count) >= confidence:
+            break
     
     if android_count > ios_count:
         logger.info(f"Detected Android format ({android_count} vs {ios_count} iOS matches)")
@@ -280,15 +464,18 @@ def detect_platform(lines: List[str]) -> str:
 
 
 def parse_chat(
-    file_content: Union[bytes, str, Path], 
-    platform: str = "auto"
+    file_content: Union[bytes, str, Path, Iterable[bytes]], 
+    platform: str = "auto",
+    skip_media: bool = False
 ) -> pd.DataFrame:
     """
     Parse WhatsApp chat export into a structured DataFrame.
     
     Args:
-        file_content: Chat export content as bytes, string, or file path
+        file_content: Chat export content as bytes, string, file path, or an
+            iterable of byte chunks (e.g. streamed from stdin)
         platform: Platform identifier ('android', 'ios', or 'auto')
+        skip_media: Drop media placeholder messages while parsing
         
     Returns:
         DataFrame with columns: Date, Time, Author, Message, ts, date, hour, dow, is_media
@@ -297,90 +484,238 @@ def parse_chat(
         ChatParseError: If parsing fails
         PlatformDetectionError: If platform detection fails
     """
+    # File paths are streamed rather than read into memory first
+    if _is_existing_path(file_content):
+        return parse_chat_path(file_content, platform, skip_media=skip_media)
+    
     try:
-        # Handle file path input
-        if isinstance(file_content, (str, Path)) and Path(file_content).exists():
-            with open(file_content, 'rb') as f:
-                file_content = f.read()
-        
-        # Decode content
-        lines = _decode_file_content(file_content)
-        
-        # Auto-detect platform if requested
-        if platform == "auto":
-            platform = detect_platform(lines)
-        
-        logger.info(f"Parsing chat with platform: {platform}")
-        
-        # Parse messages
-        parsed_messages = []
-        message_buffer = []
-        current_date = current_time = current_author = None
-        
-        parse_line_func = _parse_android_line if platform == "android" else _parse_ios_line
-        is_format_func = _is_android_format if platform == "android" else _is_ios_format
-        
-        for line in lines:
-            cleaned_line = _clean_line(line)
-            if not cleaned_line:
-                continue
-                
-            if is_format_func(cleaned_line):
-                # Flush previous message buffer
-                if message_buffer:
-                    parsed_messages.append([
-                        current_date, current_time, current_author, 
-                        " ".join(message_buffer).strip()
-                    ])
-                    message_buffer.clear()
-                
-                # Parse new message header
-                current_date, current_time, current_author, message = parse_line_func(cleaned_line)
-                message_buffer.append(message)
-            else:
-                # Continue previous message
-                message_buffer.append(cleaned_line)
-        
-        # Flush final message
-        if message_buffer:
-            parsed_messages.append([
-                current_date, current_time, current_author,
-                " ".join(message_buffer).strip()
-            ])
-        
-        if not parsed_messages:
-            raise ChatParseError("No messages found in chat export")
-        
-        # Create DataFrame
-        df = pd.DataFrame(parsed_messages, columns=["Date", "Time", "Author", "Message"])
-        
-        # Parse timestamps
-        df["ts"] = df.apply(
-            lambda row: _parse_timestamp(row["Date"], row["Time"], platform), 
-            axis=1
-        )
+        if isinstance(file_content, (bytes, bytearray, str)):
+            lines = _decode_file_content(file_content)
+            return _parse_lines(lines, platform, skip_media)
+        
+        # Chunked input is decoded incrementally as the chunks arrive
+        reader = io.BufferedReader(_ChunkReader(file_content), buffer_size=STREAM_BUFFER_SIZE)
+        return _parse_binary_stream(reader, platform, skip_media)
+    except Exception as e:
+        logger.error(f"Failed to parse chat: {e}")
+        raise ChatParseError(f"Chat parsing failed: {e}")
+
+
+def parse_chat_path(
+    path: Union[str, Path],
+    platform: str = "auto",
+    chunksize: int = STREAM_BUFFER_SIZE,
+    skip_media: bool = False
+) -> pd.DataFrame:
+    """
+    Parse a WhatsApp chat export file, streaming it line by line.
+    
+    The file is decoded incrementally, so the raw bytes and the full decoded
+    text are never held in memory at the same time.
+    
+    Args:
+        path: Path to the chat export
+        platform: Platform identifier ('android', 'ios', or 'auto')
+        chunksize: Read buffer size in bytes
+        skip_media: Drop media placeholder messages while parsing
         
-        # Remove rows with invalid timestamps
-        df = df.dropna(subset=["ts"]).reset_index(drop=True)
+    Returns:
+        DataFrame with columns: Date, Time, Author, Message, ts, date, hour, dow, is_media
         
-        if df.empty:
-            raise ChatParseError("No valid timestamps found after parsing")
+    Raises:
+        ChatParseError: If parsing fails
+    """
+    try:
+        with open(path, "rb", buffering=chunksize) as reader:
+            return _parse_binary_stream(reader, platform, skip_media)
+    except Exception as e:
+        logger.error(f"Failed to parse chat: {e}")
+        raise ChatParseError(f"Chat parsing failed: {e}")
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only raw stream over an iterable of byte chunks."""
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        
+        # Coalesce tiny leading chunks so the first read covers any BOM
+        head = b""
+        for chunk in self._chunks:
+            head += chunk
+            if len(head) >= 4:
+                break
+        self._pending = memoryview(head)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _parse_binary_stream(
+    reader: io.BufferedReader,
+    platform: str,
+    skip_media: bool = False
+) -> pd.DataFrame:
+    """
+    Decode a buffered binary stream line by line and parse it.
+    
+    Args:
+        reader: Buffered binary stream positioned at the start of the export
+        platform: Platform identifier ('android', 'ios', or 'auto')
+        skip_media: Drop media placeholder messages while parsing
         
-        # Add derived fields
-        df["date"] = df["ts"].dt.date
-        df["hour"] = df["ts"].dt.hour
-        df["dow"] = df["ts"].dt.day_name()
+    Returns:
+        Parsed chat DataFrame
+    """
+    encoding = _sniff_encoding(reader.peek(4)[:4])
+    with io.TextIOWrapper(reader, encoding=encoding, errors="replace") as text:
+        return _parse_lines((line.rstrip("\n") for line in text), platform, skip_media)
+
+
+def _is_existing_path(file_content: Union[bytes, str, Path]) -> bool:
+    """Check whether parse_chat input refers to an existing file."""
+    if not isinstance(file_content, (str, Path)):
+        return False
+    try:
+        return Path(file_content).is_file()
+    except (OSError, ValueError):
+        # Raw chat text passed as str can be too long or invalid as a path
+        return False
+
+
+def _is_media_message(message: str) -> bool:
+    """
+    Check whether a message body is a media placeholder.
+    
+    Args:
+        message: Joined, stripped message text
         
-        # Flag media messages
-        df["is_media"] = (
-            df["Message"].eq("<Media omitted>") |
-            df["Message"].str.contains("<Media omitted>", na=False) |
-            df["Message"].str.contains("omitted", case=False, na=False)
-        )
+    Returns:
+        True if the message stands in for a media attachment
+    """
+    # Exact placeholders first; anything else falls back to the broad
+    # case-insensitive test, which also covers case variants and iOS documents
+    return message in MEDIA_PLACEHOLDERS or "omitted" in message.lower()
+
+
+def _parse_lines(lines: Iterable[str], platform: str, skip_media: bool = False) -> pd.DataFrame:
+    """
+    Parse decoded chat lines into the message DataFrame.
+    
+    Args:
+        lines: Decoded lines, as a list or a lazy iterator
+        platform: Platform identifier ('android', 'ios', or 'auto')
+        skip_media: Drop media placeholder messages before they become rows
         
-        logger.info(f"Successfully parsed {len(df)} messages")
-        return df
+    Returns:
+        DataFrame with columns: Date, Time, Author, Message, ts, date, hour, dow, is_media
         
-    except Exception as e:
-        logger.error(f"Failed to parse chat: {e}")
-        raise ChatParseError(f"Chat parsing failed: {e}") 
\ No newline at end of file
+    Raises:
+        ChatParseError: If no messages are found
+        PlatformDetectionError: If platform detection fails
+    """
+    # Auto-detect platform from the head of the export, then keep streaming
+    if platform == "auto":
+        lines = iter(lines)
+        head = list(islice(lines, DETECTION_SAMPLE_LINES))
+        platform = detect_platform(head)
+        lines = chain(head, lines)
+    
+    logger.info(f"Parsing chat with platform: {platform}")
+    
+    # Parse messages straight into per-column lists
+    dates, times, authors, messages = [], [], [], []
+    message_buffer = []
+    
+    parse_line_func = _parse_android_line if platform == "android" else _parse_ios_line
+    match_header = _match_android_header if platform == "android" else _match_ios_header
+    
+    def flush_message() -> None:
+        message = " ".join(message_buffer).strip()
+        message_buffer.clear()
+        if skip_media and _is_media_message(message):
+            # Discard the header fields already recorded for this message
+            dates.pop()
+            times.pop()
+            authors.pop()
+        else:
+            messages.append(message)
+    
+    for line in lines:
+        cleaned_line = _clean_line(line)
+        if not cleaned_line:
+            continue
+        
+        # A single match both classifies the line and feeds the parser
+        header_match = match_header(cleaned_line)
+        if header_match:
+            # Flush previous message buffer
+            if message_buffer:
+                flush_message()
+            
+            # Parse new message header
+            date, time, author, message = parse_line_func(cleaned_line, header_match)
+            dates.append(date)
+            times.append(time)
+            authors.append(author)
+            message_buffer.append(message)
+        else:
+            # Text before the first header becomes a row without a timestamp
+            if not message_buffer:
+                dates.append(None)
+                times.append(None)
+                authors.append(None)
+            # Continue previous message
+            message_buffer.append(cleaned_line)
+    
+    # Flush final message
+    if message_buffer:
+        flush_message()
+    
+    if not messages:
+        raise ChatParseError("No messages found in chat export")
+    
+    # Create DataFrame
+    df = pd.DataFrame({"Date": dates, "Time": times, "Author": authors, "Message": messages})
+    
+    # Parse timestamps
+    df["ts"] = _parse_timestamps(df["Date"] + " " + df["Time"], platform)
+    
+    # Remove rows with invalid timestamps
+    df = df.dropna(subset=["ts"]).reset_index(drop=True)
+    
+    if df.empty:
+        raise ChatParseError("No valid timestamps found after parsing")
+    
+    # Add derived fields
+    # Midnight timestamps rather than datetime.date objects keep "date" a
+    # native datetime64 column that groups and compares without boxing
+    df["date"] = df["ts"].dt.normalize()
+    df["hour"] = df["ts"].dt.hour.astype("int8")
+    df["dow"] = pd.Categorical(df["ts"].dt.day_name(), categories=DAYS_OF_WEEK, ordered=True)
+    # Few distinct authors over many rows: store int codes so groupbys and
+    # value_counts hash small integers instead of full strings
+    df["Author"] = df["Author"].astype("category")
+    
+    # Flag media messages: exact placeholders via a hash lookup, then a
+    # case-insensitive "omitted" test for the rest (case variants and iOS
+    # documents prefixed with the file name)
+    is_media = df["Message"].isin(MEDIA_PLACEHOLDERS).to_numpy(copy=True)
+    rest = ~is_media
+    is_media[rest] = df["Message"][rest].str.contains("omitted", case=False, regex=False, na=False)
+    df["is_media"] = is_media
+    
+    logger.info(f"Successfully parsed {len(df)} messages")
+    return df
@@ -5,13 +5,21 @@ This module provides a modern, interactive web interface for analyzing
 WhatsApp chat exports with real-time visualizations and insights.
 """
 
+import hashlib
+import inspect
+import io
 import logging
 import streamlit as st
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import json
+from itertools import islice
 
-from ..core.parser import parse_chat, detect_platform, ChatParseError, PlatformDetectionError
+import pandas as pd
+
+from ..core.parser import (
+    parse_chat, detect_platform, ChatParseError, PlatformDetectionError, DETECTION_SAMPLE_LINES
+)
 from ..core.analyzer import ChatAnalyzer
 from ..utils.emoji_extractor import extract_emojis
 
@@ -19,6 +27,29 @@ from ..utils.emoji_extractor import extract_emojis
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer the C-implemented orjson encoder for JSON exports, fallback to json
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    orjson = None
+    USING_ORJSON = False
+
+# Newer Streamlit APIs, detected once so the app still runs on older
+# releases: tabs that track the open tab (1.65) and fragments (1.37, or
+# experimental_fragment from 1.33). Without them every tab renders and
+# panel widgets rerun the whole app.
+_LAZY_TABS = "on_change" in inspect.signature(st.tabs).parameters
+_fragment = (
+    getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    or (lambda func: func)
+)
+
+# Parsed uploads kept in server memory across sessions: at most this many
+# (file, options) combinations, each dropped after PARSE_CACHE_TTL seconds
+PARSE_CACHE_ENTRIES = 4
+PARSE_CACHE_TTL = 3600
+
 
 def setup_page_config():
     """Configure Streamlit page settings."""
@@ -57,23 +88,6 @@ def create_sidebar() -> Dict[str, Any]:
             help="Replace participant names with User 1, User 2, etc."
         )
         
-        threshold_hours = st.slider(
-            "Conversation Gap Threshold (hours)",
-            min_value=1,
-            max_value=24,
-            value=1,
-            help="Hours of inactivity to consider as new conversation"
-        )
-        
-        # --- NEW: Sentiment rolling average slider ---
-        sentiment_window = st.slider(
-            "Sentiment Rolling Average (days)",
-            min_value=1,
-            max_value=30,
-            value=7,
-            help="Number of days for the sentiment rolling average window"
-        )
-
         # Debug options
         with st.expander("🔧 Debug Options"):
             show_debug = st.toggle("Show Parsing Debug", value=False)
@@ -89,15 +103,28 @@ def create_sidebar() -> Dict[str, Any]:
             "platform": platform_key,
             "include_media": include_media,
             "anonymize": anonymize,
-            "threshold_hours": threshold_hours,
-            "sentiment_window": sentiment_window, # New option
             "show_debug": show_debug,
             "run_tests": run_tests
         }
 
 
-def display_upload_section() -> Optional[bytes]:
-    """Display file upload section and return uploaded content."""
+def _content_key(uploaded_file, content: bytes) -> str:
+    """
+    Return the digest identifying an upload, hashing its bytes only once.
+    
+    Upload ids are stable across reruns, so the digest of the current
+    upload is kept in session state and reused until a new file arrives.
+    """
+    cached = st.session_state.get("_upload_digest")
+    if cached is not None and cached[0] == uploaded_file.file_id:
+        return cached[1]
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    st.session_state["_upload_digest"] = (uploaded_file.file_id, digest)
+    return digest
+
+
+def display_upload_section() -> Optional[Tuple[bytes, str]]:
+    """Display file upload section and return uploaded content and its cache key."""
     st.title("📱 WhatsApp Chat Analyzer")
     st.caption(
         "Upload a WhatsApp chat export (.txt) to analyze conversation patterns, "
@@ -117,7 +144,7 @@ def display_upload_section() -> Optional[bytes]:
     try:
         content = uploaded_file.getvalue()
         st.success(f"✅ Successfully uploaded {len(content)} bytes")
-        return content
+        return content, _content_key(uploaded_file, content)
     except Exception as e:
         st.error(f"❌ Failed to read uploaded file: {e}")
         st.stop()
@@ -138,9 +165,15 @@ def display_debug_info(content: bytes, platform: str, show_debug: bool):
                 "platform_selected": platform
             })
             
+            # Decode once and split only the head that detection samples
+            text = content.decode("utf-8", errors="ignore")
+            lines = [
+                line.rstrip("\n")
+                for line in islice(io.StringIO(text, newline=None), DETECTION_SAMPLE_LINES)
+            ]
+            
             # Platform detection
             try:
-                lines = content.decode("utf-8", errors="ignore").splitlines()
                 detected_platform = detect_platform(lines)
                 st.write(f"**Platform Detection:** {detected_platform}")
             except Exception as e:
@@ -148,37 +181,74 @@ def display_debug_info(content: bytes, platform: str, show_debug: bool):
             
             # Sample lines
             st.write("**Sample Lines (first 5):**")
-            sample_lines = content.decode("utf-8", errors="ignore").splitlines()[:5]
-            for i, line in enumerate(sample_lines):
+            for i, line in enumerate(lines[:5]):
                 st.code(f"{i+1}: {line}")
                 
         except Exception as e:
             st.error(f"Debug info error: {e}")
 
 
-def parse_and_analyze_chat(content: bytes, options: Dict[str, Any]) -> ChatAnalyzer:
+@st.cache_data(show_spinner=False, max_entries=PARSE_CACHE_ENTRIES, ttl=PARSE_CACHE_TTL)
+def _parse_df(content_key: str, _content: bytes, platform: str, include_media: bool) -> pd.DataFrame:
+    """
+    Parse an uploaded export once per distinct file and parse options.
+    
+    The raw bytes are excluded from Streamlit's argument hashing (leading
+    underscore); ``content_key`` is their digest and identifies the file.
+    Media placeholders are dropped by the parser itself when excluded, so
+    they never enter the DataFrame.
+    """
+    return parse_chat(_content, platform=platform, skip_media=not include_media)
+
+
+def _build_analyzer(
+    content_key: str, content: bytes, platform: str, include_media: bool, anonymize: bool
+) -> ChatAnalyzer:
+    """
+    Return the analyzer for a file and the options that change its input data.
+    
+    The analyzer is kept in this session's state, so reruns (slider changes,
+    tab switches) reuse it and its memoized results instead of re-parsing and
+    re-scoring sentiment. Each session holds only its current analyzer, and
+    no two sessions share one, since the analyzer memoizes results into
+    itself without locking.
+    """
+    key = (content_key, platform, include_media, anonymize)
+    cached = st.session_state.get("_analyzer")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    df = _parse_df(content_key, content, platform, include_media)
+    
+    # Anonymize if requested
+    if anonymize:
+        mapping = {
+            author: f"User {i+1}" 
+            for i, author in enumerate(sorted(df["Author"].dropna().unique()))
+        }
+        df = df.assign(Author=df["Author"].map(mapping))
+    
+    analyzer = ChatAnalyzer(df)
+    st.session_state["_analyzer"] = (key, analyzer)
+    return analyzer
+
+
+def parse_and_analyze_chat(content: bytes, content_key: str, options: Dict[str, Any]) -> ChatAnalyzer:
     """Parse chat content and create analyzer instance."""
     with st.spinner("🔄 Parsing and analyzing chat data..."):
         try:
-            # Parse chat
-            df = parse_chat(content, platform=options["platform"])
+            analyzer = _build_analyzer(
+                content_key, content, options["platform"],
+                options["include_media"], options["anonymize"]
+            )
             
-            # Apply filters
             if not options["include_media"]:
-                df = df[~df["is_media"]]
-                st.info(f"📊 Filtered out media messages. {len(df)} text messages remaining.")
-            
-            # Anonymize if requested
+                st.info(
+                    f"📊 Filtered out media messages. "
+                    f"{len(analyzer.chat_data)} text messages remaining."
+                )
             if options["anonymize"]:
-                mapping = {
-                    author: f"User {i+1}" 
-                    for i, author in enumerate(sorted(df["Author"].dropna().unique()))
-                }
-                df["Author"] = df["Author"].map(mapping)
                 st.info("🔒 Participant names anonymized.")
-            
-            # Create analyzer
-            analyzer = ChatAnalyzer(df)
             return analyzer
             
         except (ChatParseError, PlatformDetectionError) as e:
@@ -262,11 +332,12 @@ def display_sentiment_debugging(analyzer: ChatAnalyzer):
             st.info("No text messages available to sample.")
             return
 
-        for _, row in samples.iterrows():
-            author = row['Author'] if row['Author'] else "Unknown"
-            message = row['Message']
-            score = row['sentiment_score']
-            label = row['sentiment_label']
+        for row in samples.itertuples(index=False):
+            # Missing authors come back as NaN, which is truthy
+            author = row.Author if pd.notna(row.Author) and row.Author else "Unknown"
+            message = row.Message
+            score = row.sentiment_score
+            label = row.sentiment_label
             
             # Use columns for a cleaner layout
             col1, col2 = st.columns([4, 1])
@@ -284,9 +355,23 @@ def display_sentiment_debugging(analyzer: ChatAnalyzer):
             st.markdown("---")
 
 # --- NEW: Function to display sentiment analysis ---
-def display_sentiment_analysis(analyzer: ChatAnalyzer, rolling_window: int):
-    """Display sentiment analysis over time."""
+@_fragment
+def display_sentiment_analysis(analyzer: ChatAnalyzer):
+    """
+    Display sentiment analysis over time.
+    
+    Runs as a fragment that owns its rolling-window slider, so moving the
+    slider reruns only this panel instead of the whole app.
+    """
     st.subheader("😊 Sentiment Over Time")
+    rolling_window = st.slider(
+        "Sentiment Rolling Average (days)",
+        min_value=1,
+        max_value=30,
+        value=7,
+        key="sentiment_window",
+        help="Number of days for the sentiment rolling average window"
+    )
     st.write(
         f"This chart shows the {rolling_window}-day rolling average of the chat's sentiment. "
         "Scores above 0 are positive, and scores below 0 are negative."
@@ -316,9 +401,23 @@ def display_participant_analysis(analyzer: ChatAnalyzer):
         st.dataframe(participant_stats, use_container_width=True)
 
 
-def display_engagement_metrics(analyzer: ChatAnalyzer, threshold_hours: int):
-    """Display engagement and response metrics."""
+@_fragment
+def display_engagement_metrics(analyzer: ChatAnalyzer):
+    """
+    Display engagement and response metrics.
+    
+    Runs as a fragment that owns its gap-threshold slider, so moving the
+    slider reruns only this panel instead of the whole app.
+    """
     st.subheader("⚡ Engagement Metrics")
+    threshold_hours = st.slider(
+        "Conversation Gap Threshold (hours)",
+        min_value=1,
+        max_value=24,
+        value=1,
+        key="threshold_hours",
+        help="Hours of inactivity to consider as new conversation"
+    )
     
     col1, col2 = st.columns(2)
     
@@ -364,8 +463,10 @@ def display_emoji_analysis(analyzer: ChatAnalyzer):
             with col2:
                 if emoji_analysis["top_emojis"]:
                     st.write("**Most Used Emojis:**")
-                    for emoji, count in emoji_analysis["top_emojis"][:10]:
-                        st.write(f"{emoji} x{count}")
+                    st.dataframe(
+                        pd.DataFrame(emoji_analysis["top_emojis"][:10], columns=["Emoji", "Count"]),
+                        hide_index=True, use_container_width=True
+                    )
         else:
             st.info("No emojis found in the chat")
             
@@ -391,8 +492,10 @@ def display_word_analysis(analyzer: ChatAnalyzer):
             with col2:
                 if word_analysis["top_words"]:
                     st.write("**Most Used Words:**")
-                    for word, count in word_analysis["top_words"][:15]:
-                        st.write(f"'{word}' x{count}")
+                    st.dataframe(
+                        pd.DataFrame(word_analysis["top_words"][:15], columns=["Word", "Count"]),
+                        hide_index=True, use_container_width=True
+                    )
         else:
             st.info("No word data available")
             
@@ -416,43 +519,33 @@ def display_export_options(analyzer: ChatAnalyzer):
     """Display data export options."""
     st.subheader("💾 Export Options")
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        # CSV export
-        csv_data = analyzer.chat_data.to_csv(index=False).encode("utf-8")
+        # CSV export, encoded chunk by chunk straight into a byte buffer
+        csv_buffer = io.BytesIO()
+        analyzer.chat_data.to_csv(csv_buffer, index=False, encoding="utf-8")
         st.download_button(
             "📊 Download CSV",
-            data=csv_data,
+            data=csv_buffer.getvalue(),
             file_name="whatsapp_chat_analysis.csv",
             mime="text/csv"
         )
     
     with col2:
-        # Excel export with robust temporary file handling
-        import tempfile
-        import os
-
-        tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
-        tmp_filename = tmp_file.name
-        tmp_file.close()
-
+        # Excel export, built in memory
         try:
-            analyzer.export_analysis_report(tmp_filename)
-            with open(tmp_filename, 'rb') as f:
-                excel_data = f.read()
+            excel_buffer = io.BytesIO()
+            analyzer.export_analysis_report(excel_buffer)
             
             st.download_button(
                 "📊 Download Excel Report",
-                data=excel_data,
+                data=excel_buffer.getvalue(),
                 file_name="whatsapp_chat_analysis.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
         except Exception as e:
             st.error(f"Excel export failed: {e}")
-        finally:
-            if os.path.exists(tmp_filename):
-                os.unlink(tmp_filename)
     
     with col3:
         # JSON export
@@ -465,17 +558,83 @@ def display_export_options(analyzer: ChatAnalyzer):
 
         try:
             insights = analyzer.get_all_insights()
-            sanitized_insights = convert_keys_to_str(insights)
-            json_data = json.dumps(sanitized_insights, indent=2, default=str, ensure_ascii=False)
+            if USING_ORJSON:
+                # orjson stringifies non-str keys itself, so no sanitizing walk
+                options = (
+                    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+                json_data = orjson.dumps(insights, option=options, default=str)
+            else:
+                sanitized_insights = convert_keys_to_str(insights)
+                json_data = json.dumps(
+                    sanitized_insights, indent=2, default=str, ensure_ascii=False
+                ).encode("utf-8")
             
             st.download_button(
                 "📊 Download JSON",
-                data=json_data.encode("utf-8"),
+                data=json_data,
                 file_name="whatsapp_chat_insights.json",
                 mime="application/json"
             )
         except Exception as e:
             st.error(f"JSON export failed: {e}")
+    
+    with col4:
+        # Parquet export: columnar and compressed, written by Arrow's C++ writer
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            st.caption("Install pyarrow to enable Parquet export.")
+        else:
+            try:
+                parquet_buffer = io.BytesIO()
+                analyzer.chat_data.to_parquet(
+                    parquet_buffer, engine="pyarrow", compression="zstd", index=False
+                )
+                st.download_button(
+                    "📊 Download Parquet",
+                    data=parquet_buffer.getvalue(),
+                    file_name="whatsapp_chat_analysis.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+            except Exception as e:
+                st.error(f"Parquet export failed: {e}")
+
+
+def display_analysis_tabs(analyzer: ChatAnalyzer):
+    """
+    Display the analysis panels as tabs, running only the selected one.
+    
+    With ``on_change="rerun"`` Streamlit tracks the selected tab, so panels
+    such as emoji analysis or the Excel export are computed only when the
+    user opens them rather than on every run. Streamlit releases without
+    that API render every panel.
+    """
+    def display_emoji_and_words():
+        display_emoji_analysis(analyzer)
+        display_word_analysis(analyzer)
+    
+    panels = {
+        "📈 Activity": lambda: display_activity_charts(analyzer),
+        "😊 Sentiment": lambda: display_sentiment_analysis(analyzer),
+        "👥 Participants": lambda: display_participant_analysis(analyzer),
+        "⚡ Engagement": lambda: display_engagement_metrics(analyzer),
+        "😀 Emoji & Words": display_emoji_and_words,
+        "📋 Data": lambda: display_data_preview(analyzer),
+        "💾 Export": lambda: display_export_options(analyzer),
+    }
+    if not _LAZY_TABS:
+        for tab, render in zip(st.tabs(list(panels)), panels.values()):
+            with tab:
+                render()
+        return
+    
+    tabs = st.tabs(list(panels), key="analysis_tab", on_change="rerun")
+    for tab, render in zip(tabs, panels.values()):
+        if tab.open:
+            with tab:
+                render()
 
 
 def run_developer_tests(run_tests: bool):
@@ -502,40 +661,19 @@ def main():
         options = create_sidebar()
         
         # Display upload section
-        content = display_upload_section()
+        content, content_key = display_upload_section()
         
         # Show debug info if enabled
         display_debug_info(content, options["platform"], options["show_debug"])
         
         # Parse and analyze chat
-        analyzer = parse_and_analyze_chat(content, options)
+        analyzer = parse_and_analyze_chat(content, content_key, options)
         
         # Display results
         display_key_metrics(analyzer)
         
-        # Activity patterns
-        display_activity_charts(analyzer)
-
-        # --- NEW: Call the sentiment analysis display function ---
-        display_sentiment_analysis(analyzer, options["sentiment_window"])
-        
-        # Participant analysis
-        display_participant_analysis(analyzer)
-        
-        # Engagement metrics
-        display_engagement_metrics(analyzer, options["threshold_hours"])
-        
-        # Emoji analysis
-        display_emoji_analysis(analyzer)
-        
-        # Word analysis
-        display_word_analysis(analyzer)
-        
-        # Data preview
-        display_data_preview(analyzer)
-        
-        # Export options
-        display_export_options(analyzer)
+        # Analysis panels, one tab each
+        display_analysis_tabs(analyzer)
         
         # Developer tests
         run_developer_tests(options["run_tests"])
@@ -543,8 +681,8 @@ def main():
         # Footer
         st.markdown("---")
         st.caption(
-            "🔒 **Privacy**: All analysis is performed locally in your browser. "
-            "No chat data is stored on our servers."
+            "🔒 **Privacy**: Chats are analyzed in memory and never written to disk. "
+            "Results are cleared when you close the page; cached parses expire after an hour."
         )
         
     except Exception as e: